@@ -33,9 +33,13 @@ def load_queue() -> List[Dict]:
 
 def save_item(item: Dict):
     """Append a new item to the queue."""
+    save_items([item])
+
+def save_items(items: List[Dict]):
+    """Append new items to the queue in one write."""
     ensure_queue_dir()
     with open(QUEUE_PATH, 'a') as f:
-        f.write(json.dumps(item) + '\n')
+        f.write(''.join(json.dumps(item) + '\n' for item in items))
 
 def update_queue(items: List[Dict]):
     """Rewrite the entire queue with updated items."""
@@ -44,18 +48,22 @@ def update_queue(items: List[Dict]):
         for item in items:
             f.write(json.dumps(item) + '\n')
 
+def _next_hitl_ids(count: int) -> List[str]:
+    """Reserve the next count HITL-YYYYMMDD-NNN IDs with one queue read."""
+    prefix = f"HITL-{datetime.now().strftime('%Y%m%d')}"
+    existing = len([item for item in load_queue() if item['id'].startswith(prefix)])
+    return [f"{prefix}-{existing + n:03d}" for n in range(1, count + 1)]
+
 def generate_hitl_id() -> str:
     """Generate a unique HITL ID."""
-    timestamp = datetime.now().strftime("%Y%m%d")
-    counter = len([item for item in load_queue() if item['id'].startswith(f"HITL-{timestamp}")]) + 1
-    return f"HITL-{timestamp}-{counter:03d}"
+    return _next_hitl_ids(1)[0]
 
-def add_hitl_item(meeting_id: str, reason: str, context: Dict) -> str:
-    """Add a new HITL item to the queue."""
-    item = {
-        "id": generate_hitl_id(),
+def _new_item(hitl_id: str, meeting_id: str, reason: str, context: Dict, created_at: str) -> Dict:
+    """Build a pending HITL queue item."""
+    return {
+        "id": hitl_id,
         "meeting_id": meeting_id,
-        "created_at": datetime.now(timezone.utc).isoformat(),
+        "created_at": created_at,
         "reason": reason,
         "context": context,
         "status": "pending",
@@ -63,9 +71,20 @@ def add_hitl_item(meeting_id: str, reason: str, context: Dict) -> str:
         "resolved_at": None,
         "resolution": None
     }
-    
-    save_item(item)
-    return item["id"]
+
+def add_hitl_item(meeting_id: str, reason: str, context: Dict) -> str:
+    """Add a new HITL item to the queue."""
+    return add_hitl_items(meeting_id, reason, [context])[0]
+
+def add_hitl_items(meeting_id: str, reason: str, contexts: List[Dict]) -> List[str]:
+    """Add several HITL items for one meeting with a single queue read and append."""
+    created_at = datetime.now(timezone.utc).isoformat()
+    items = [
+        _new_item(hitl_id, meeting_id, reason, context, created_at)
+        for hitl_id, context in zip(_next_hitl_ids(len(contexts)), contexts)
+    ]
+    save_items(items)
+    return [item["id"] for item in items]
 
 def resolve_item(hitl_id: str, action: str, parameters: Optional[Dict] = None, resolved_by: str = "manual"):
     """Mark an item as resolved."""
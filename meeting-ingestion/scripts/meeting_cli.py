@@ -10,7 +10,7 @@ Usage:
     python3 meeting_cli.py identify <meeting> [--dry-run] 
     python3 meeting_cli.py gate <meeting> [--dry-run]
     python3 meeting_cli.py process <meeting> [--blocks B01,B05] [--dry-run]
-    python3 meeting_cli.py tick [--dry-run]
+    python3 meeting_cli.py tick [--batch N] [--watch] [--dry-run]
 
     # Legacy Commands (v2 compatibility) 
     python3 meeting_cli.py stage [--dry-run]
@@ -19,10 +19,21 @@ Usage:
     python3 meeting_cli.py fix
 """
 
+import os
+import re
 import sys
 import json
+import queue
 import argparse
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Optional
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 SKILL_DIR = Path(__file__).parent.parent
 sys.path.insert(0, str(SKILL_DIR / "scripts"))
@@ -30,6 +41,33 @@ sys.path.insert(0, str(SKILL_DIR / "scripts"))
 INBOX = Path("./Personal/Meetings/Inbox")
 MEETINGS = Path("./Personal/Meetings")
 
+# Statuses `tick` can advance, and the depth of each inter-stage queue
+TICK_READY_STATUSES = ("ingested", "identified", "gated")
+PIPELINE_QUEUE_SIZE = 2
+
+# Raw transcript extensions counted by `status`, and manifest read concurrency
+RAW_SUFFIXES = frozenset({"md", "txt"})
+STATUS_SCAN_WORKERS = 8
+_STATUS_BYTES_RE = re.compile(rb'"status"\s*:\s*"([^"\\]*)"')
+
+_PIPELINE_DONE = object()
+_thread_state = threading.local()
+
+# Built lazily by main() and reused across calls
+_PARSER = None
+
+
+def _emit_json(obj) -> None:
+    """Write obj as indented JSON straight to stdout's byte buffer."""
+    if orjson is not None:
+        data = orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    else:
+        data = json.dumps(obj, indent=2).encode("utf-8")
+    
+    sys.stdout.flush()  # keep ordering with any text already printed
+    sys.stdout.buffer.write(data + b"\n")
+    sys.stdout.buffer.flush()
+
 
 # === v3 Pipeline Commands ===
 
@@ -51,7 +89,7 @@ def cmd_ingest(args):
             result = ingestor.ingest_folder(str(path), dry_run=args.dry_run)
         
         if args.json:
-            print(json.dumps(result, indent=2))
+            _emit_json(result)
         else:
             status = result.get('status', 'unknown')
             print(f"\n{'[DRY RUN] ' if args.dry_run else ''}Ingest: {status}")
@@ -105,7 +143,7 @@ def cmd_identify(args):
             print(f"  Meeting classification: {classification}")
         
         if args.json:
-            print(json.dumps(results, indent=2))
+            _emit_json(results)
         else:
             print(f"\n{'[DRY RUN] ' if args.dry_run else ''}✅ Identification complete")
             
@@ -116,10 +154,22 @@ def cmd_identify(args):
     return 0
 
 
+def _find_transcript(meeting_path: Path) -> Optional[Path]:
+    """Return the meeting's transcript.md/transcript.txt, if present."""
+    base = str(meeting_path) + os.sep
+    for fname in ("transcript.md", "transcript.txt"):
+        if os.path.exists(base + fname):
+            return meeting_path / fname
+    return None
+
+
+def _run_gate(meeting_path: Path, manifest_path: Path) -> dict:
+    """Run the quality gate for a meeting; shared by `gate` and `tick`."""
+    return _get_quality_gate().execute(manifest_path, _find_transcript(meeting_path))
+
+
 def cmd_gate(args):
     """Run quality gate validation for a meeting."""
-    from quality_gate import QualityGate
-    
     meeting_path = Path(args.meeting)
     if not meeting_path.exists() or not meeting_path.is_dir():
         print(f"Error: Meeting folder not found: {meeting_path}")
@@ -135,20 +185,10 @@ def cmd_gate(args):
             print(f"[DRY RUN] Would run quality gate on {meeting_path}")
             return 0
         
-        # Find transcript file
-        transcript_path = None
-        for fname in ["transcript.md", "transcript.txt"]:
-            candidate = meeting_path / fname
-            if candidate.exists():
-                transcript_path = candidate
-                break
-        
-        # Run quality gate
-        gate = QualityGate()
-        result = gate.execute(manifest_path, transcript_path)
+        result = _run_gate(meeting_path, manifest_path)
         
         if args.json:
-            print(json.dumps(result, indent=2))
+            _emit_json(result)
         else:
             passed = result.get('passed', False)
             score = result.get('score', 0.0)
@@ -171,90 +211,284 @@ def cmd_gate(args):
     return 0
 
 
-def cmd_tick(args):
-    """Process the next meeting in the queue through the full pipeline."""
+def _get_crm():
+    """Return this thread's CRMEnricher, creating it on first use.
+
+    sqlite connections are bound to the thread that opened them, so the
+    enricher is memoized per thread rather than per process.
+    """
+    crm = getattr(_thread_state, "crm", None)
+    if crm is None:
+        from crm_enricher import CRMEnricher
+        crm = _thread_state.crm = CRMEnricher()
+    return crm
+
+
+def _get_quality_gate():
+    """Return this thread's QualityGate, creating it on first use."""
+    gate = getattr(_thread_state, "quality_gate", None)
+    if gate is None:
+        from quality_gate import QualityGate
+        gate = _thread_state.quality_gate = QualityGate()
+    return gate
+
+
+def _collect_tick_queue() -> list:
+    """Return (meeting_path, status) pairs ready for the next stage, oldest first."""
+    meetings_to_process = []
+    
+    if INBOX.exists():
+        for item in INBOX.iterdir():
+            if item.is_dir() and not item.name.startswith('.'):
+                try:
+                    manifest = json.loads((item / "manifest.json").read_text())
+                except (OSError, ValueError):
+                    continue
+                status = manifest.get("status", "")
+                # Look for meetings ready for next stage
+                if status in TICK_READY_STATUSES:
+                    meetings_to_process.append((item, status))
+    
+    # Sort by creation time
+    meetings_to_process.sort(key=lambda x: x[0].stat().st_mtime)
+    return meetings_to_process
+
+
+def _tick_identify(meeting_path: Path, manifest_path: Path) -> bool:
+    """Pipeline stage 1: calendar triangulation + CRM enrichment."""
+    print(f"  [{meeting_path.name}] Running identification...")
     try:
-        # Find next meeting that needs processing
-        meetings_to_process = []
-        
-        if INBOX.exists():
-            for item in INBOX.iterdir():
-                if item.is_dir() and not item.name.startswith('.'):
-                    manifest_path = item / "manifest.json"
-                    if manifest_path.exists():
-                        try:
-                            manifest = json.loads(manifest_path.read_text())
-                            status = manifest.get("status", "")
-                            # Look for meetings ready for next stage
-                            if status in ["ingested", "identified", "gated"]:
-                                meetings_to_process.append((item, status))
-                        except:
-                            continue
-        
-        if not meetings_to_process:
-            print("No meetings in queue ready for processing")
-            return 0
-        
-        # Sort by creation time and take the first one
-        meetings_to_process.sort(key=lambda x: x[0].stat().st_mtime)
-        meeting_path, current_status = meetings_to_process[0]
-        
-        print(f"{'[DRY RUN] ' if args.dry_run else ''}Processing next meeting: {meeting_path.name}")
+        from calendar_match import match_meeting_to_calendar
+        manifest_data = json.loads(manifest_path.read_text())
+        match_meeting_to_calendar(manifest_data)
+        _get_crm().enrich_meeting(str(meeting_path))
+    except Exception as e:
+        print(f"    ❌ [{meeting_path.name}] Identification failed: {e}")
+        return False
+    return True
+
+
+def _tick_gate(meeting_path: Path, manifest_path: Path) -> bool:
+    """Pipeline stage 2: quality gate validation."""
+    print(f"  [{meeting_path.name}] Running quality gate...")
+    try:
+        gate_result = _run_gate(meeting_path, manifest_path)
+        if not gate_result.get('passed', False):
+            print(f"    ❌ [{meeting_path.name}] Quality gate failed (escalated to HITL)")
+            return False
+    except Exception as e:
+        print(f"    ❌ [{meeting_path.name}] Quality gate failed: {e}")
+        return False
+    return True
+
+
+def _tick_process(meeting_path: Path) -> bool:
+    """Pipeline stage 3: block processing (currently manual)."""
+    print(f"  ⚠️  [{meeting_path.name}] Block processing requires manual intervention")
+    print(f"    Use: meeting_cli.py process {meeting_path} to generate blocks")
+    return True
+
+
+def _run_tick_pipeline(meetings: list) -> dict:
+    """
+    Run identify → gate → process over queued meetings as a thread pipeline.
+    
+    Each stage owns one worker thread and hands meetings downstream through a
+    bounded queue, so meeting B is identified while meeting A is being gated.
+    Returns {meeting_path: success}.
+    """
+    to_gate = queue.Queue(maxsize=PIPELINE_QUEUE_SIZE)
+    to_process = queue.Queue(maxsize=PIPELINE_QUEUE_SIZE)
+    results = {}
+    
+    def identify_stage():
+        try:
+            for meeting_path, status in meetings:
+                manifest_path = meeting_path / "manifest.json"
+                ok = _tick_identify(meeting_path, manifest_path) if status == "ingested" else True
+                to_gate.put((meeting_path, manifest_path, status, ok))
+        finally:
+            to_gate.put(_PIPELINE_DONE)
+    
+    def gate_stage():
+        try:
+            while (item := to_gate.get()) is not _PIPELINE_DONE:
+                meeting_path, manifest_path, status, ok = item
+                if ok and status in ("ingested", "identified"):
+                    ok = _tick_gate(meeting_path, manifest_path)
+                to_process.put((meeting_path, status, ok))
+        finally:
+            to_process.put(_PIPELINE_DONE)
+    
+    def process_stage():
+        while (item := to_process.get()) is not _PIPELINE_DONE:
+            meeting_path, status, ok = item
+            if ok:
+                ok = _tick_process(meeting_path)
+            results[meeting_path] = ok
+    
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        stages = [pool.submit(stage) for stage in (identify_stage, gate_stage, process_stage)]
+        for stage in stages:
+            stage.result()
+    
+    return results
+
+
+def _tick_batch(batch: list, dry_run: bool = False) -> None:
+    """Announce and run (meeting_path, status) pairs through the tick pipeline."""
+    for meeting_path, current_status in batch:
+        print(f"{'[DRY RUN] ' if dry_run else ''}Processing next meeting: {meeting_path.name}")
         print(f"  Current status: {current_status}")
         
-        if args.dry_run:
+        if dry_run:
             if current_status == "ingested":
                 print("  Would run: identify → gate → process")
             elif current_status == "identified": 
                 print("  Would run: gate → process")
             elif current_status == "gated":
                 print("  Would run: process")
-            return 0
+    
+    if dry_run:
+        return
+    
+    # Run appropriate pipeline steps
+    results = _run_tick_pipeline(batch)
+    
+    for meeting_path, _ in batch:
+        status = "✅ Success" if results.get(meeting_path) else "❌ Failed"
+        print(f"\nTick result ({meeting_path.name}): {status}")
+
+
+def _watch_tick(args):
+    """
+    Long-running tick: dispatch meetings as their manifests change.
+    
+    Subscribes to manifest create/modify/close-after-write and rename events
+    under INBOX instead of rescanning the whole inbox on every invocation.
+    Only the changed meeting's manifest is re-peeked. Requires `watchdog`;
+    close events are Linux-only, so create/modify cover other backends.
+    """
+    try:
+        from watchdog.events import FileSystemEventHandler
+        from watchdog.observers import Observer
+    except ImportError:
+        print("Error: --watch requires the watchdog package (pip install watchdog)")
+        return 1
+    
+    pending = queue.Queue()
+    queued = set()
+    queued_lock = threading.Lock()
+    # Manifest mtime after we last handled each meeting, so the pipeline's
+    # own manifest writes don't re-trigger it
+    handled = {}
+    
+    INBOX.mkdir(parents=True, exist_ok=True)
+    # Backends report paths in different forms (relative to the watch on
+    # inotify, absolute and symlink-resolved on FSEvents), so compare
+    # resolved paths and queue meetings in INBOX's own form
+    inbox_root = INBOX.resolve()
+    
+    def enqueue(meeting_path: Path):
+        if meeting_path.parent.resolve() != inbox_root or meeting_path.name[:1] in "._":
+            return
+        meeting_path = INBOX / meeting_path.name
+        with queued_lock:
+            if meeting_path in queued:
+                return
+            queued.add(meeting_path)
+        pending.put(meeting_path)
+    
+    class ManifestHandler(FileSystemEventHandler):
+        def _on_path(self, path: str, is_directory: bool):
+            path = Path(path)
+            if is_directory:
+                enqueue(path)
+            elif path.name == "manifest.json":
+                enqueue(path.parent)
         
-        # Run appropriate pipeline steps
-        success = True
+        def _on_file(self, event):
+            if not event.is_directory:
+                self._on_path(event.src_path, False)
         
-        if current_status == "ingested":
-            print("  Running identification...")
-            try:
-                from calendar_match import match_meeting_to_calendar
-                from crm_enricher import CRMEnricher
-                manifest_data = json.loads((meeting_path / "manifest.json").read_text())
-                match_meeting_to_calendar(manifest_data)
-                crm = CRMEnricher()
-                crm.enrich_meeting(str(meeting_path))
-            except Exception as e:
-                print(f"    ❌ Identification failed: {e}")
-                success = False
+        # Duplicate events for one write are absorbed by `queued` and the
+        # handled-mtime check
+        on_created = on_modified = on_closed = _on_file
         
-        if success and current_status in ["ingested", "identified"]:
-            print("  Running quality gate...")
+        def on_moved(self, event):
+            self._on_path(event.dest_path, event.is_directory)
+    
+    observer = Observer()
+    observer.schedule(ManifestHandler(), str(INBOX), recursive=True)
+    observer.start()
+    
+    # Drain whatever is already waiting before blocking on events
+    for meeting_path, _ in _collect_tick_queue():
+        enqueue(meeting_path)
+    
+    print(f"{'[DRY RUN] ' if args.dry_run else ''}Watching {INBOX} for ready meetings (Ctrl-C to stop)")
+    
+    try:
+        while True:
+            drained = [pending.get()]
+            while True:
+                try:
+                    drained.append(pending.get_nowait())
+                except queue.Empty:
+                    break
+            
+            batch = []
+            for meeting_path in drained:
+                with queued_lock:
+                    queued.discard(meeting_path)
+                try:
+                    mtime_ns = (meeting_path / "manifest.json").stat().st_mtime_ns
+                except OSError:
+                    continue
+                if handled.get(meeting_path) == mtime_ns:
+                    continue
+                
+                peek = _peek_manifest_status(str(meeting_path))
+                if peek and peek[1] in TICK_READY_STATUSES:
+                    batch.append((meeting_path, peek[1]))
+                else:
+                    handled[meeting_path] = mtime_ns
+            
+            if not batch:
+                continue
+            
             try:
-                from quality_gate import QualityGate
-                # Find transcript file
-                transcript_path = None
-                for fname in ["transcript.md", "transcript.txt"]:
-                    candidate = meeting_path / fname
-                    if candidate.exists():
-                        transcript_path = candidate
-                        break
-
-                manifest_path = meeting_path / "manifest.json"
-                gate = QualityGate()
-                gate_result = gate.execute(manifest_path, transcript_path)
-                if not gate_result.get('passed', False):
-                    print(f"    ❌ Quality gate failed (escalated to HITL)")
-                    success = False
+                _tick_batch(batch, dry_run=args.dry_run)
             except Exception as e:
-                print(f"    ❌ Quality gate failed: {e}")
-                success = False
+                print(f"Error: {e}")
+            
+            for meeting_path, _ in batch:
+                try:
+                    handled[meeting_path] = (meeting_path / "manifest.json").stat().st_mtime_ns
+                except OSError:
+                    handled.pop(meeting_path, None)
+    except KeyboardInterrupt:
+        print("\nStopping watcher")
+    finally:
+        observer.stop()
+        observer.join()
+    
+    return 0
+
+
+def cmd_tick(args):
+    """Process the next meeting(s) in the queue through the full pipeline."""
+    if args.watch:
+        return _watch_tick(args)
+    
+    try:
+        meetings_to_process = _collect_tick_queue()
         
-        if success and current_status in ["ingested", "identified", "gated"]:
-            print("  ⚠️  Block processing requires manual intervention")
-            print("    Use: meeting_cli.py process <meeting> to generate blocks")
+        if not meetings_to_process:
+            print("No meetings in queue ready for processing")
+            return 0
         
-        status = "✅ Success" if success else "❌ Failed"
-        print(f"\nTick result: {status}")
+        _tick_batch(meetings_to_process[:max(1, args.batch)], dry_run=args.dry_run)
         
     except Exception as e:
         print(f"Error: {e}")
@@ -272,7 +506,7 @@ def cmd_stage(args):
     results = stage_all(dry_run=args.dry_run)
     
     if args.json:
-        print(json.dumps(results, indent=2))
+        _emit_json(results)
     else:
         print(f"\n{'[DRY RUN] ' if args.dry_run else ''}[LEGACY] Staging Results:")
         print(f"  Staged:  {len(results.get('staged', []))}") 
@@ -299,12 +533,14 @@ def cmd_process(args):
         if not meeting_path.exists():
             print(f"Error: Path not found: {meeting_path}")
             return 1
-        results = process_meeting(meeting_path, blocks=blocks, dry_run=args.dry_run)
+        results = process_meeting(meeting_path, blocks=blocks, dry_run=args.dry_run,
+                                  checkpoint=args.checkpoint, batch_blocks=args.batch_blocks)
     else:
-        results = process_queue(batch_size=args.batch_size, blocks=blocks, dry_run=args.dry_run)
+        results = process_queue(batch_size=args.batch_size, blocks=blocks, dry_run=args.dry_run,
+                                checkpoint=args.checkpoint, batch_blocks=args.batch_blocks)
     
     if args.json:
-        print(json.dumps(results, indent=2))
+        _emit_json(results)
     else:
         if "meetings" in results:
             print(f"\n{'[DRY RUN] ' if args.dry_run else ''}Queue Processing:")
@@ -330,11 +566,37 @@ def cmd_archive(args):
     results = archive_all(dry_run=dry_run)
     
     if args.json:
-        print(json.dumps(results, indent=2))
+        _emit_json(results)
     
     return 0
 
 
+def _peek_manifest_status(meeting_dir: str) -> Optional[tuple]:
+    """Return (schema_version, status) for a meeting folder, or None if it has no readable manifest."""
+    try:
+        with open(os.path.join(meeting_dir, "manifest.json"), "rb") as f:
+            data = f.read()
+        
+        # Fast path: read both fields straight from the bytes. The first
+        # "status" key is the top-level one as long as json.dump wrote it
+        # ahead of status_history, which every writer in this skill does.
+        if b'"schema_version"' not in data:
+            schema_version = "v2"
+        elif b'"schema_version": "v3"' in data or b'"schema_version":"v3"' in data:
+            schema_version = "v3"
+        else:
+            schema_version = None
+        
+        status_match = _STATUS_BYTES_RE.search(data)
+        if schema_version and status_match:
+            return schema_version, status_match.group(1).decode("utf-8")
+        
+        manifest = json.loads(data)
+        return manifest.get("schema_version", "v2"), manifest.get("status", "unknown")
+    except (OSError, ValueError):
+        return None
+
+
 def cmd_status(args):
     """Show current ingestion status with v3 manifest support."""
     # v3 status counting
@@ -349,43 +611,53 @@ def cmd_status(args):
     complete = 0
     raw_files = 0
     
+    dir_candidates = []
     if INBOX.exists():
-        for item in INBOX.iterdir():
-            if item.name.startswith((".", "_")):
-                continue
-            
-            if item.is_file() and item.suffix in [".md", ".txt"]:
-                raw_files += 1
-                continue
-            
-            if item.is_dir():
-                manifest_path = item / "manifest.json"
-                if manifest_path.exists():
-                    try:
-                        manifest = json.loads(manifest_path.read_text())
-                        status = manifest.get("status", "unknown")
-                        schema_version = manifest.get("schema_version", "v2")
-                        
-                        if schema_version == "v3":
-                            # v3 status
-                            if status == "ingested":
-                                v3_ingested += 1
-                            elif status == "identified":
-                                v3_identified += 1
-                            elif status == "gated":
-                                v3_gated += 1 
-                            elif status == "complete":
-                                v3_complete += 1
-                        else:
-                            # Legacy status
-                            if status == "staged":
-                                staged += 1
-                            elif status == "processing":
-                                processing += 1
-                            elif status == "complete":
-                                complete += 1
-                    except:
-                        pass
+        # Single pass: classify raw files vs. meeting folders
+        with os.scandir(INBOX) as it:
+            for entry in it:
+                name = entry.name
+                if name[:1] in "._":
+                    continue
+                
+                if entry.is_file(follow_symlinks=False):
+                    _, dot, ext = name.rpartition(".")
+                    if dot and ext in RAW_SUFFIXES:
+                        raw_files += 1
+                    continue
+                
+                if entry.is_dir(follow_symlinks=False):
+                    dir_candidates.append(entry.path)
+    
+    if dir_candidates:
+        with ThreadPoolExecutor(max_workers=STATUS_SCAN_WORKERS) as pool:
+            peeked = list(pool.map(_peek_manifest_status, dir_candidates))
+    else:
+        peeked = []
+    
+    for peek in peeked:
+        if peek is None:
+            continue
+        schema_version, status = peek
+        
+        if schema_version == "v3":
+            # v3 status
+            if status == "ingested":
+                v3_ingested += 1
+            elif status == "identified":
+                v3_identified += 1
+            elif status == "gated":
+                v3_gated += 1 
+            elif status == "complete":
+                v3_complete += 1
+        else:
+            # Legacy status
+            if status == "staged":
+                staged += 1
+            elif status == "processing":
+                processing += 1
+            elif status == "complete":
+                complete += 1
     
     week_folders = 0
     archived_meetings = 0
@@ -421,7 +693,7 @@ def cmd_status(args):
     }
     
     if args.json:
-        print(json.dumps(status, indent=2))
+        _emit_json(status)
     else:
         print("\nMeeting Ingestion Status")
         print("=" * 40)
@@ -464,7 +736,7 @@ def cmd_fix(args):
     print(f"  Errors: {len(stage_result.get('errors', []))}")
     
     if args.json:
-        print(json.dumps({"fix": fix_result, "stage": stage_result}, indent=2))
+        _emit_json({"fix": fix_result, "stage": stage_result})
     
     return 0
 
@@ -476,7 +748,7 @@ def cmd_pull(args):
     results = pull_transcripts(dry_run=args.dry_run, batch_size=args.batch_size)
     
     if args.json:
-        print(json.dumps(results, indent=2))
+        _emit_json(results)
     else:
         print(f"\n{'[DRY RUN] ' if args.dry_run else ''}[LEGACY] Pull Results:")
         print(f"  Ingested: {len(results.get('ingested', []))}")
@@ -486,7 +758,8 @@ def cmd_pull(args):
     return 0
 
 
-def main():
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the CLI parser; each subparser stores its handler as `func`."""
     parser = argparse.ArgumentParser(
         description="Meeting Ingestion CLI v3",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -514,6 +787,8 @@ Examples:
     meeting_cli.py identify ./meeting-2026-01-01_Test --dry-run
     meeting_cli.py gate ./meeting-2026-01-01_Test --dry-run  
     meeting_cli.py tick --dry-run                      # Process next in queue
+    meeting_cli.py tick --batch 5                      # Pipeline the next 5 meetings
+    meeting_cli.py tick --watch                        # Tick on inbox changes
     
     # Legacy Commands
     meeting_cli.py stage --dry-run                     # Preview staging
@@ -531,23 +806,29 @@ Examples:
     ingest_parser.add_argument("path", help="File or folder to ingest")
     ingest_parser.add_argument("--dry-run", action="store_true")
     ingest_parser.add_argument("--json", action="store_true")
+    ingest_parser.set_defaults(func=cmd_ingest)
     
     # Identify
     identify_parser = subparsers.add_parser("identify", help="[v3] Run calendar + CRM enrichment") 
     identify_parser.add_argument("meeting", help="Meeting folder path")
     identify_parser.add_argument("--dry-run", action="store_true")
     identify_parser.add_argument("--json", action="store_true")
+    identify_parser.set_defaults(func=cmd_identify)
     
     # Gate
     gate_parser = subparsers.add_parser("gate", help="[v3] Run quality gate validation")
     gate_parser.add_argument("meeting", help="Meeting folder path") 
     gate_parser.add_argument("--dry-run", action="store_true")
     gate_parser.add_argument("--json", action="store_true")
+    gate_parser.set_defaults(func=cmd_gate)
     
     # Tick
     tick_parser = subparsers.add_parser("tick", help="[v3] Process next meeting in queue")
+    tick_parser.add_argument("--batch", type=int, default=1, help="Meetings to pipeline through in one tick")
+    tick_parser.add_argument("--watch", action="store_true", help="Keep running and tick meetings as their manifests change")
     tick_parser.add_argument("--dry-run", action="store_true")
     tick_parser.add_argument("--json", action="store_true")
+    tick_parser.set_defaults(func=cmd_tick)
     
     # === Legacy Commands ===
     
@@ -556,11 +837,13 @@ Examples:
     pull_parser.add_argument("--dry-run", action="store_true")
     pull_parser.add_argument("--batch-size", type=int, default=5)
     pull_parser.add_argument("--json", action="store_true")
+    pull_parser.set_defaults(func=cmd_pull)
     
     # Stage
     stage_parser = subparsers.add_parser("stage", help="[LEGACY] Stage raw transcripts")
     stage_parser.add_argument("--dry-run", action="store_true")
     stage_parser.add_argument("--json", action="store_true")
+    stage_parser.set_defaults(func=cmd_stage)
     
     # Process (enhanced to work with both v2 and v3)
     process_parser = subparsers.add_parser("process", help="Generate intelligence blocks")
@@ -568,56 +851,50 @@ Examples:
     process_parser.add_argument("--blocks", type=str)
     process_parser.add_argument("--batch-size", type=int, default=5)
     process_parser.add_argument("--dry-run", action="store_true")
+    process_parser.add_argument("--checkpoint", action="store_true")
+    process_parser.add_argument("--batch-blocks", action="store_true")
     process_parser.add_argument("--json", action="store_true")
+    process_parser.set_defaults(func=cmd_process)
     
     # Archive
     archive_parser = subparsers.add_parser("archive", help="[LEGACY] Move to weekly folders")
     archive_parser.add_argument("--dry-run", action="store_true", default=True)
     archive_parser.add_argument("--execute", action="store_true")
     archive_parser.add_argument("--json", action="store_true")
+    archive_parser.set_defaults(func=cmd_archive)
     
     # Status (enhanced for v3 support)
     status_parser = subparsers.add_parser("status", help="Show ingestion status")
     status_parser.add_argument("--json", action="store_true")
+    status_parser.set_defaults(func=cmd_status)
     
     # Fix
     fix_parser = subparsers.add_parser("fix", help="[LEGACY] Fix malformed inbox")
     fix_parser.add_argument("--dry-run", action="store_true")
     fix_parser.add_argument("--json", action="store_true")
+    fix_parser.set_defaults(func=cmd_fix)
+    
+    return parser
+
+
+def main(argv=None):
+    global _PARSER
+    if _PARSER is None:
+        _PARSER = _build_parser()
     
-    args = parser.parse_args()
+    args = _PARSER.parse_args(argv)
     
     if not args.command:
-        parser.print_help()
+        _PARSER.print_help()
         return 1
     
-    handlers = {
-        # v3 Pipeline Commands
-        "ingest": cmd_ingest,
-        "identify": cmd_identify,
-        "gate": cmd_gate,
-        "tick": cmd_tick,
-        
-        # Legacy Commands  
-        "pull": cmd_pull,
-        "stage": cmd_stage,
-        "process": cmd_process,
-        "archive": cmd_archive,
-        "status": cmd_status,
-        "fix": cmd_fix,
-    }
-    
-    handler = handlers.get(args.command)
-    if handler:
-        try:
-            return handler(args)
-        except Exception as e:
-            print(f"Error: {e}")
-            import traceback
-            traceback.print_exc()
-            return 1
-    
-    return 1
+    try:
+        return args.func(args)
+    except Exception as e:
+        print(f"Error: {e}")
+        import traceback
+        traceback.print_exc()
+        return 1
 
 
 if __name__ == "__main__":
@@ -5,16 +5,28 @@ Meeting Ingestion - Process Script (v2 with Smart Block Selector)
 Generates intelligence blocks for staged meetings using LLM-powered block selection.
 
 Usage:
-    python3 process.py [meeting_path] [--blocks B01,B05] [--dry-run] [--legacy]
+    python3 process.py [meeting_path] [--blocks B01,B05] [--dry-run] [--legacy] [--checkpoint] [--batch-blocks]
 """
 
+import functools
 import json
 import os
+import re
+import sys
 import logging
+import threading
 import requests
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
 from datetime import datetime, UTC
-from typing import Optional
+from itertools import islice
+from typing import Iterator, Optional
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 logging.basicConfig(
     level=logging.INFO,
@@ -22,13 +34,53 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# The smart block selector lives alongside this script
+_SELECTOR_DIR = str(Path(__file__).resolve().parent)
+if _SELECTOR_DIR not in sys.path:
+    sys.path.insert(0, _SELECTOR_DIR)
+try:
+    from block_selector import select_blocks
+except ImportError:
+    select_blocks = None
+
 INBOX = Path("./Personal/Meetings/Inbox")
 PROMPTS_DIR = Path("./Prompts/Blocks")
 
+# Max in-flight Zo API calls across all threads (respects API rate limits)
+API_CONCURRENCY = 8
+_API_SLOTS = threading.BoundedSemaphore(API_CONCURRENCY)
+STREAM_CHUNK_SIZE = 8192
+
+# One keep-alive session for every Zo API call; the pool holds a connection per API slot
+_SESSION = requests.Session()
+_SESSION.headers.update({"content-type": "application/json"})
+_SESSION.mount("https://", requests.adapters.HTTPAdapter(pool_maxsize=API_CONCURRENCY))
+
+# Manifest statuses process_queue picks up
+QUEUE_READY_STATUSES = ("staged", "processing")
+
+# Transcript characters sent with each block prompt, and which part of a
+# long transcript each block keeps (see pack_transcript)
+TRANSCRIPT_CHAR_LIMIT = 30000
+TAIL_WINDOW_BLOCKS = frozenset({"B02", "B05", "B25"})
+BOOKEND_WINDOW_BLOCKS = frozenset({"B01", "B03"})
+_ELISION_MARKER = "\n\n...[middle elided]...\n\n"
+_REPEATED_SPEAKER_RE = re.compile(r"^(\w+:)[ \t]*\1[ \t]*", re.MULTILINE)
+
+# With --batch-blocks, blocks requested per API call (keeps output under token limits)
+BLOCK_BATCH_SIZE = 6
+_JSON_OBJECT_FENCE_RE = re.compile(r"```(?:json)?\s*(\{.*\})\s*```", re.DOTALL)
+
+# With --checkpoint, persist the manifest after this many generated blocks
+CHECKPOINT_EVERY = 4
+
 # Legacy static block lists (kept for --legacy mode)
-EXTERNAL_BLOCKS = ["B01", "B02", "B03", "B05", "B08", "B25", "B26"]
-EXTERNAL_CONDITIONAL = ["B04", "B06", "B07", "B10", "B13", "B21", "B28"]
-INTERNAL_BLOCKS = ["B40", "B41", "B47"]
+EXTERNAL_BLOCKS = ("B01", "B02", "B03", "B05", "B08", "B25", "B26")
+EXTERNAL_CONDITIONAL = ("B04", "B06", "B07", "B10", "B13", "B21", "B28")
+INTERNAL_BLOCKS = ("B40", "B41", "B47")
+
+# One case-insensitive pass instead of lowercasing the transcript and scanning per word
+_LEGACY_RISK_RE = re.compile(r"risk|concern|worry|problem", re.IGNORECASE)
 
 BLOCK_NAMES = {
     "B00": "B00_ZO_TAKE_HEED",
@@ -93,38 +145,155 @@ BLOCK_DESCRIPTIONS = {
 }
 
 
-def call_zo_api(prompt: str) -> str:
-    """Call Zo API to generate content."""
+def _utc_now_iso() -> str:
+    """Current UTC time as an ISO-8601 string with a Z suffix, second precision."""
+    return datetime.now(UTC).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _json_loads(data: bytes):
+    """Parse JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj) -> bytes:
+    """Serialize to indented JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode("utf-8")
+
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    """Write to a sibling temp file, then rename it over path."""
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
+def _atomic_write_json(path: Path, obj) -> None:
+    """Write JSON to a sibling temp file, then rename it over path."""
+    _atomic_write(path, _json_dumps(obj))
+
+
+@contextmanager
+def _zo_response(prompt: str, stream: bool = False):
+    """POST a prompt to the Zo API, holding an API slot until the response is consumed."""
     token = os.environ.get("ZO_CLIENT_IDENTITY_TOKEN")
     if not token:
         raise RuntimeError("ZO_CLIENT_IDENTITY_TOKEN not set")
     
-    response = requests.post(
-        "<YOUR_WEBHOOK_URL>",
-        headers={
-            "authorization": token,
-            "content-type": "application/json"
-        },
-        json={"input": prompt},
-        timeout=300
-    )
+    with _API_SLOTS:
+        response = _SESSION.post(
+            "<YOUR_WEBHOOK_URL>",
+            headers={"authorization": token},
+            json={"input": prompt},
+            timeout=300,
+            stream=stream
+        )
+        try:
+            if response.status_code != 200:
+                raise RuntimeError(f"Zo API error: {response.status_code} - {response.text}")
+            yield response
+        finally:
+            response.close()
+
+
+def call_zo_api(prompt: str) -> str:
+    """Call Zo API to generate content."""
+    with _zo_response(prompt) as response:
+        return response.json().get("output", "")
+
+
+def stream_zo_api(prompt: str, out_path: Path) -> None:
+    """
+    Call Zo API and write its output to out_path as it arrives.
     
-    if response.status_code != 200:
-        raise RuntimeError(f"Zo API error: {response.status_code} - {response.text}")
+    Output goes to a hidden sibling ".{name}.partial" file and is renamed to
+    out_path only once the response is complete, so out_path never holds a
+    truncated block. Chunked text responses are flushed chunk by chunk, so a
+    crash mid-generation still keeps the partial file. JSON responses (the
+    webhook's current format) are written once the body is complete.
+    """
+    partial_path = out_path.with_name(f".{out_path.name}.partial")
+    with _zo_response(prompt, stream=True) as response:
+        content_type = response.headers.get("content-type", "")
+        
+        if not content_type.startswith("text/"):
+            partial_path.write_text(response.json().get("output", ""))
+        else:
+            if "charset" not in content_type:
+                response.encoding = "utf-8"
+            with open(partial_path, "w") as f:
+                for chunk in response.iter_content(chunk_size=STREAM_CHUNK_SIZE, decode_unicode=True):
+                    f.write(chunk)
+                    f.flush()
     
-    return response.json().get("output", "")
+    os.replace(partial_path, out_path)
 
 
+@functools.lru_cache(maxsize=64)
 def load_prompt_template(block_code: str) -> Optional[str]:
-    """Load canonical prompt from Prompts/Blocks/."""
+    """
+    Load canonical prompt from Prompts/Blocks/.
+    
+    Cached per block code for the life of the process; call
+    load_prompt_template.cache_clear() to pick up edited templates.
+    """
     prompt_path = PROMPTS_DIR / f"Generate_{block_code}.prompt.md"
     if prompt_path.exists():
         return prompt_path.read_text()
     return None
 
 
-def generate_block(transcript: str, block_code: str, context: dict) -> str:
-    """Generate a single intelligence block."""
+def compact_transcript(transcript: str) -> str:
+    """Collapse doubled speaker tags ("Alex: Alex: ...") left by some exporters."""
+    return _REPEATED_SPEAKER_RE.sub(r"\1 ", transcript)
+
+
+def transcript_window(block_code: str) -> str:
+    """Which part of an over-long transcript a block keeps: head, tail or bookends."""
+    if block_code in TAIL_WINDOW_BLOCKS:
+        return "tail"
+    if block_code in BOOKEND_WINDOW_BLOCKS:
+        return "bookends"
+    return "head"
+
+
+def pack_transcript(transcript: str, block_code: str, max_chars: int = TRANSCRIPT_CHAR_LIMIT) -> str:
+    """
+    Fit a transcript into max_chars for a given block.
+    
+    Action-item blocks keep the end of the meeting, where commitments
+    cluster; recap/decision blocks keep both ends around an elision marker;
+    everything else keeps the opening, as before.
+    """
+    if len(transcript) <= max_chars:
+        return transcript
+    
+    window = transcript_window(block_code)
+    if window == "tail":
+        return transcript[-max_chars:]
+    if window == "bookends":
+        half = (max_chars - len(_ELISION_MARKER)) // 2
+        return transcript[:half] + _ELISION_MARKER + transcript[-half:]
+    return transcript[:max_chars]
+
+
+def format_context_block(context: dict) -> str:
+    """Render the meeting context lines shared by every block prompt."""
+    return f"""- Date: {context.get('date', 'Unknown')}
+- Participants: {', '.join(context.get('participants', ['Unknown']))}
+- Meeting Type: {context.get('meeting_type', 'external')}"""
+
+
+def build_block_prompt(transcript_clip: str, context_block: str, block_code: str) -> str:
+    """
+    Build the generation prompt for a single intelligence block.
+    
+    transcript_clip and context_block are prepared once per meeting
+    (see process_meeting) so each block only interpolates them.
+    """
     full_name = BLOCK_NAMES.get(block_code, block_code)
     description = BLOCK_DESCRIPTIONS.get(block_code, "Meeting intelligence block")
     
@@ -134,12 +303,10 @@ def generate_block(transcript: str, block_code: str, context: dict) -> str:
         prompt = f"""{prompt_template}
 
 ## Transcript to Analyze
-{transcript[:30000]}
+{transcript_clip}
 
 ## Meeting Context
-- Date: {context.get('date', 'Unknown')}
-- Participants: {', '.join(context.get('participants', []))}
-- Meeting Type: {context.get('meeting_type', 'external')}
+{context_block}
 
 ## CRITICAL INSTRUCTION
 Output ONLY the block content directly as markdown. Start with the heading "# {full_name}" immediately.
@@ -152,12 +319,10 @@ Do NOT include meta-commentary about what you're generating.
 {block_code}: {description}
 
 ## Meeting Context
-- Date: {context.get('date', 'Unknown')}
-- Participants: {', '.join(context.get('participants', ['Unknown']))}
-- Meeting Type: {context.get('meeting_type', 'external')}
+{context_block}
 
 ## Transcript
-{transcript[:30000]}
+{transcript_clip}
 
 ## Instructions
 1. Analyze the transcript thoroughly
@@ -168,7 +333,101 @@ Do NOT include meta-commentary about what you're generating.
 
 Return ONLY the block content in markdown format."""
 
-    return call_zo_api(prompt)
+    return prompt
+
+
+def generate_block(transcript_clip: str, context_block: str, block_code: str) -> str:
+    """Generate a single intelligence block."""
+    return call_zo_api(build_block_prompt(transcript_clip, context_block, block_code))
+
+
+def write_block(transcript_clip: str, context_block: str, block_code: str, block_file: Path) -> None:
+    """Generate a single intelligence block, streaming it into block_file."""
+    stream_zo_api(build_block_prompt(transcript_clip, context_block, block_code), block_file)
+
+
+def build_batch_prompt(transcript_clip: str, context_block: str, block_codes: list[str]) -> str:
+    """Build one prompt asking for several blocks as a JSON object keyed by block code."""
+    definitions = []
+    for block_code in block_codes:
+        full_name = BLOCK_NAMES.get(block_code, block_code)
+        instructions = load_prompt_template(block_code) or (
+            f"{block_code}: {BLOCK_DESCRIPTIONS.get(block_code, 'Meeting intelligence block')}"
+        )
+        definitions.append(f"### {block_code} (heading: # {full_name})\n{instructions}")
+    
+    return f"""Generate the following intelligence blocks for this meeting transcript.
+
+## Block Definitions
+{chr(10).join(definitions)}
+
+## Meeting Context
+{context_block}
+
+## Transcript
+{transcript_clip}
+
+## Output Format
+Return ONLY a JSON object with keys exactly: {', '.join(block_codes)}.
+Each value is that block's content as markdown, starting with the heading given above.
+Do NOT include meta-commentary or any text outside the JSON object.
+"""
+
+
+def parse_batch_output(output: str, block_codes: list[str]) -> dict:
+    """Extract {block_code: markdown} from a batch response; unusable entries are omitted."""
+    try:
+        data = json.loads(output)
+    except ValueError:
+        match = _JSON_OBJECT_FENCE_RE.search(output)
+        if not match:
+            return {}
+        try:
+            data = json.loads(match.group(1))
+        except ValueError:
+            return {}
+    
+    if not isinstance(data, dict):
+        return {}
+    return {
+        block_code: data[block_code]
+        for block_code in block_codes
+        if isinstance(data.get(block_code), str) and data[block_code].strip()
+    }
+
+
+def generate_blocks_batch(transcript_clip: str, context_block: str, block_codes: list[str]) -> dict:
+    """Generate several blocks with one Zo API call; returns the blocks that parsed."""
+    output = call_zo_api(build_batch_prompt(transcript_clip, context_block, block_codes))
+    return parse_batch_output(output, block_codes)
+
+
+def write_block_batch(transcript_clip: str, context_block: str, block_codes: list[str],
+                      meeting_path: Path) -> dict:
+    """
+    Generate block_codes with one batched call and write each block file.
+    
+    Blocks missing from the batch response (or the whole batch, if the call
+    fails) fall back to single-block calls. Returns {block_code: error} for
+    blocks that still failed.
+    """
+    try:
+        contents = generate_blocks_batch(transcript_clip, context_block, block_codes)
+    except Exception as e:
+        logger.warning(f"    Batch call failed, falling back to single blocks: {e}")
+        contents = {}
+    
+    errors = {}
+    for block_code in block_codes:
+        block_file = meeting_path / f"{BLOCK_NAMES.get(block_code, block_code)}.md"
+        try:
+            if block_code in contents:
+                _atomic_write(block_file, contents[block_code].encode("utf-8"))
+            else:
+                write_block(transcript_clip, context_block, block_code, block_file)
+        except Exception as e:
+            errors[block_code] = str(e)
+    return errors
 
 
 def use_smart_selector(transcript: str, meeting_type: str, participants: list[str]) -> dict:
@@ -178,10 +437,8 @@ def use_smart_selector(transcript: str, meeting_type: str, participants: list[st
     Returns selection result with reasoning and logging info.
     """
     try:
-        # Import the block selector
-        import sys
-        sys.path.insert(0, str(Path("./Skills/meeting-ingestion/scripts")))
-        from block_selector import select_blocks
+        if select_blocks is None:
+            raise RuntimeError("block_selector module not available")
         
         result = select_blocks(transcript, meeting_type, participants)
         return {
@@ -196,24 +453,27 @@ def use_smart_selector(transcript: str, meeting_type: str, participants: list[st
         }
 
 
+@functools.lru_cache(maxsize=16)
+def _read_transcript(path: str, mtime_ns: int, size: int) -> str:
+    """Read a transcript; the stat fields in the cache key invalidate edited files."""
+    return Path(path).read_text()
+
+
 def determine_blocks_legacy(manifest: dict, transcript: str) -> list[str]:
     """Legacy static block selection (kept for --legacy mode)."""
     meeting_type = manifest.get("meeting_type", "external")
     
     if meeting_type == "internal":
-        return INTERNAL_BLOCKS.copy()
+        return list(INTERNAL_BLOCKS)
     
-    blocks = EXTERNAL_BLOCKS.copy()
-    
-    transcript_lower = transcript.lower()
+    # Conditional extras are disjoint from EXTERNAL_BLOCKS, so no dedupe is needed
+    extras = []
     if "?" in transcript and len(transcript) > 500:
-        if "B04" not in blocks:
-            blocks.append("B04")
-    if any(word in transcript_lower for word in ["risk", "concern", "worry", "problem"]):
-        if "B10" not in blocks:
-            blocks.append("B10")
+        extras.append("B04")
+    if _LEGACY_RISK_RE.search(transcript):
+        extras.append("B10")
     
-    return blocks
+    return list(EXTERNAL_BLOCKS) + extras
 
 
 def determine_blocks(manifest: dict, transcript: str, use_legacy: bool = False) -> tuple[list[str], dict]:
@@ -260,15 +520,23 @@ def determine_blocks(manifest: dict, transcript: str, use_legacy: bool = False)
 
 
 def process_meeting(meeting_path: Path, blocks: Optional[list[str]] = None, 
-                   dry_run: bool = False, use_legacy: bool = False) -> dict:
-    """Process a single meeting folder."""
+                   dry_run: bool = False, use_legacy: bool = False,
+                   checkpoint: bool = False, batch_blocks: bool = False) -> dict:
+    """
+    Process a single meeting folder.
+    
+    The manifest is written once when the meeting finishes. With checkpoint=True
+    it is also written when processing starts and every CHECKPOINT_EVERY blocks.
+    With batch_blocks=True, up to BLOCK_BATCH_SIZE blocks share one API call
+    (see generate_blocks_batch).
+    """
     logger.info(f"Processing: {meeting_path.name}")
     
     manifest_path = meeting_path / "manifest.json"
     if not manifest_path.exists():
         return {"error": "no manifest.json - run stage first", "path": str(meeting_path)}
     
-    manifest = json.loads(manifest_path.read_text())
+    manifest = _json_loads(manifest_path.read_bytes())
     
     if manifest.get("status") == "complete":
         logger.info(f"  Already complete, skipping")
@@ -285,7 +553,8 @@ def process_meeting(meeting_path: Path, blocks: Optional[list[str]] = None,
     if not transcript_file.exists():
         return {"error": "no transcript found", "path": str(meeting_path)}
     
-    transcript = transcript_file.read_text()
+    st = transcript_file.stat()
+    transcript = _read_transcript(str(transcript_file), st.st_mtime_ns, st.st_size)
     if len(transcript.strip()) < 100:
         return {"error": f"transcript too short ({len(transcript)} chars)", "path": str(meeting_path)}
     
@@ -297,21 +566,24 @@ def process_meeting(meeting_path: Path, blocks: Optional[list[str]] = None,
     else:
         blocks_to_generate, selection_metadata = determine_blocks(manifest, transcript, use_legacy)
     
+    # Manual lists and the selector can repeat codes; keep first occurrence only
+    blocks_to_generate = list(dict.fromkeys(blocks_to_generate))
+    
     # Log selection to manifest
     manifest["block_selection"] = {
-        "selected_at": datetime.now(UTC).isoformat().replace("+00:00", "Z"),
+        "selected_at": _utc_now_iso(),
         **selection_metadata
     }
     
-    already_generated = set(manifest.get("blocks_generated", []))
+    already_generated = frozenset(manifest.get("blocks_generated", []))
     blocks_to_generate = [b for b in blocks_to_generate if BLOCK_NAMES.get(b, b) not in already_generated]
     
     if not blocks_to_generate:
         logger.info(f"  All blocks already generated")
         manifest["status"] = "complete"
-        manifest["processed_at"] = datetime.now(UTC).isoformat().replace("+00:00", "Z")
+        manifest["processed_at"] = _utc_now_iso()
         if not dry_run:
-            manifest_path.write_text(json.dumps(manifest, indent=2))
+            _atomic_write_json(manifest_path, manifest)
         return {"status": "already_complete", "path": str(meeting_path)}
     
     logger.info(f"  Selection method: {selection_metadata.get('method', 'unknown')}")
@@ -331,7 +603,8 @@ def process_meeting(meeting_path: Path, blocks: Optional[list[str]] = None,
         }
     
     manifest["status"] = "processing"
-    manifest_path.write_text(json.dumps(manifest, indent=2))
+    if checkpoint:
+        _atomic_write_json(manifest_path, manifest)
     
     context = {
         "date": manifest.get("date"),
@@ -339,6 +612,15 @@ def process_meeting(meeting_path: Path, blocks: Optional[list[str]] = None,
         "meeting_type": manifest.get("meeting_type", "external")
     }
     
+    # Shared by every block prompt for this meeting; one clip per window shape
+    compacted = compact_transcript(transcript)
+    clips = {}
+    for block_code in blocks_to_generate:
+        window = transcript_window(block_code)
+        if window not in clips:
+            clips[window] = pack_transcript(compacted, block_code)
+    context_block = format_context_block(context)
+    
     result = {
         "path": str(meeting_path),
         "blocks_generated": [],
@@ -346,66 +628,106 @@ def process_meeting(meeting_path: Path, blocks: Optional[list[str]] = None,
         "selection_metadata": selection_metadata
     }
     
-    for block_code in blocks_to_generate:
-        full_name = BLOCK_NAMES.get(block_code, block_code)
-        logger.info(f"  Generating {full_name}...")
+    # One job per block, or with batch_blocks one job per BLOCK_BATCH_SIZE blocks
+    # sharing a transcript window
+    if batch_blocks:
+        by_window = {}
+        for block_code in blocks_to_generate:
+            by_window.setdefault(transcript_window(block_code), []).append(block_code)
+        jobs = [
+            (window, codes[i:i + BLOCK_BATCH_SIZE])
+            for window, codes in by_window.items()
+            for i in range(0, len(codes), BLOCK_BATCH_SIZE)
+        ]
+    else:
+        jobs = [(transcript_window(block_code), [block_code]) for block_code in blocks_to_generate]
+    
+    # Jobs are independent: fan the API calls out, then record results in order
+    with ThreadPoolExecutor(max_workers=min(API_CONCURRENCY, len(jobs))) as pool:
+        pending = []
+        for window, block_codes in jobs:
+            logger.info(f"  Generating {', '.join(BLOCK_NAMES.get(b, b) for b in block_codes)}...")
+            if batch_blocks:
+                future = pool.submit(write_block_batch, clips[window], context_block, block_codes, meeting_path)
+            else:
+                block_file = meeting_path / f"{BLOCK_NAMES.get(block_codes[0], block_codes[0])}.md"
+                future = pool.submit(write_block, clips[window], context_block, block_codes[0], block_file)
+            pending.append((block_codes, future))
         
-        try:
-            content = generate_block(transcript, block_code, context)
+        for block_codes, future in pending:
+            try:
+                errors = future.result() or {}
+            except Exception as e:
+                errors = {block_code: str(e) for block_code in block_codes}
             
-            block_file = meeting_path / f"{full_name}.md"
-            block_file.write_text(content)
-            
-            # Initialize blocks_generated if needed
-            if "blocks_generated" not in manifest:
-                manifest["blocks_generated"] = []
-            manifest["blocks_generated"].append(full_name)
-            result["blocks_generated"].append(full_name)
-            logger.info(f"    ✓ Written: {full_name}.md")
-            
-        except Exception as e:
-            logger.error(f"    ✗ Failed: {e}")
-            if "blocks_failed" not in manifest:
-                manifest["blocks_failed"] = []
-            manifest["blocks_failed"].append({"block": full_name, "error": str(e)})
-            result["blocks_failed"].append({"block": full_name, "error": str(e)})
+            for block_code in block_codes:
+                full_name = BLOCK_NAMES.get(block_code, block_code)
+                error = errors.get(block_code)
+                
+                if error is None:
+                    # Initialize blocks_generated if needed
+                    if "blocks_generated" not in manifest:
+                        manifest["blocks_generated"] = []
+                    manifest["blocks_generated"].append(full_name)
+                    result["blocks_generated"].append(full_name)
+                    logger.info(f"    ✓ Written: {full_name}.md")
+                    
+                    if checkpoint and len(result["blocks_generated"]) % CHECKPOINT_EVERY == 0:
+                        _atomic_write_json(manifest_path, manifest)
+                else:
+                    logger.error(f"    ✗ Failed {full_name}: {error}")
+                    if "blocks_failed" not in manifest:
+                        manifest["blocks_failed"] = []
+                    manifest["blocks_failed"].append({"block": full_name, "error": error})
+                    result["blocks_failed"].append({"block": full_name, "error": error})
     
     manifest["status"] = "complete"
-    manifest["processed_at"] = datetime.now(UTC).isoformat().replace("+00:00", "Z")
-    manifest_path.write_text(json.dumps(manifest, indent=2))
+    manifest["processed_at"] = _utc_now_iso()
+    _atomic_write_json(manifest_path, manifest)
     
     logger.info(f"  Complete: {len(result['blocks_generated'])} generated, {len(result['blocks_failed'])} failed")
     
     return result
 
 
+def iter_candidates() -> Iterator[Path]:
+    """
+    Yield inbox meeting folders ready for processing, in name order.
+    
+    Manifests are only read as the caller advances, so taking the first
+    few candidates does not parse the rest of the inbox.
+    """
+    with os.scandir(INBOX) as it:
+        folders = sorted(
+            (entry for entry in it
+             if entry.is_dir() and not entry.name.startswith((".", "_"))),
+            key=lambda entry: entry.name
+        )
+    
+    for entry in folders:
+        try:
+            with open(os.path.join(entry.path, "manifest.json"), "rb") as f:
+                data = f.read()
+            # Most folders are complete; skip the JSON parse unless a ready status can appear
+            if b'"staged"' not in data and b'"processing"' not in data:
+                continue
+            manifest = _json_loads(data)
+        except (OSError, ValueError):
+            continue
+        
+        if manifest.get("status") in QUEUE_READY_STATUSES:
+            yield Path(entry.path)
+
+
 def process_queue(batch_size: int = 5, blocks: Optional[list[str]] = None,
-                 dry_run: bool = False, use_legacy: bool = False) -> dict:
+                 dry_run: bool = False, use_legacy: bool = False,
+                 checkpoint: bool = False, batch_blocks: bool = False) -> dict:
     """Process all staged meetings in queue."""
     logger.info(f"Processing queue (batch_size={batch_size})")
     
     if not INBOX.exists():
         return {"error": "inbox not found"}
     
-    candidates = []
-    for folder in sorted(INBOX.iterdir()):
-        if not folder.is_dir() or folder.name.startswith((".", "_")):
-            continue
-        
-        manifest_path = folder / "manifest.json"
-        if not manifest_path.exists():
-            continue
-        
-        try:
-            manifest = json.loads(manifest_path.read_text())
-            status = manifest.get("status")
-            if status in ["staged", "processing"]:
-                candidates.append(folder)
-        except:
-            continue
-    
-    logger.info(f"Found {len(candidates)} meetings ready for processing")
-    
     results = {
         "processed": 0,
         "succeeded": 0,
@@ -413,22 +735,35 @@ def process_queue(batch_size: int = 5, blocks: Optional[list[str]] = None,
         "meetings": []
     }
     
-    for folder in candidates[:batch_size]:
-        try:
-            result = process_meeting(folder, blocks=blocks, dry_run=dry_run, use_legacy=use_legacy)
-            results["meetings"].append(result)
-            results["processed"] += 1
-            
-            if result.get("blocks_failed"):
-                results["failed"] += 1
-            else:
-                results["succeeded"] += 1
+    # Meetings are independent; API concurrency is capped globally by _API_SLOTS.
+    # Each ready meeting is submitted as soon as the scan finds it, so block
+    # generation overlaps reading the remaining manifests.
+    with ThreadPoolExecutor(max_workers=max(1, batch_size)) as pool:
+        futures = [
+            (folder, pool.submit(process_meeting, folder, blocks=blocks, dry_run=dry_run,
+                                 use_legacy=use_legacy, checkpoint=checkpoint,
+                                 batch_blocks=batch_blocks))
+            for folder in islice(iter_candidates(), max(0, batch_size))
+        ]
+        
+        logger.info(f"Queued {len(futures)} meetings for processing")
+        
+        for folder, future in futures:
+            try:
+                result = future.result()
+                results["meetings"].append(result)
+                results["processed"] += 1
                 
-        except Exception as e:
-            logger.error(f"Error processing {folder.name}: {e}")
-            results["meetings"].append({"path": str(folder), "error": str(e)})
-            results["processed"] += 1
-            results["failed"] += 1
+                if result.get("blocks_failed"):
+                    results["failed"] += 1
+                else:
+                    results["succeeded"] += 1
+                    
+            except Exception as e:
+                logger.error(f"Error processing {folder.name}: {e}")
+                results["meetings"].append({"path": str(folder), "error": str(e)})
+                results["processed"] += 1
+                results["failed"] += 1
     
     logger.info(f"Queue complete: {results['succeeded']}/{results['processed']} succeeded")
     return results
@@ -443,6 +778,8 @@ def main():
     parser.add_argument("--batch-size", type=int, default=5, help="Max meetings from queue")
     parser.add_argument("--dry-run", action="store_true", help="Preview without processing")
     parser.add_argument("--legacy", action="store_true", help="Use legacy static block selection (not smart selector)")
+    parser.add_argument("--checkpoint", action="store_true", help="Also persist the manifest while blocks are being generated")
+    parser.add_argument("--batch-blocks", action="store_true", help="Request several blocks per API call")
     parser.add_argument("--json", action="store_true", help="Output as JSON")
     
     args = parser.parse_args()
@@ -456,9 +793,13 @@ def main():
         if not meeting_path.exists():
             print(f"Error: Path not found: {meeting_path}")
             return 1
-        results = process_meeting(meeting_path, blocks=blocks, dry_run=args.dry_run, use_legacy=args.legacy)
+        results = process_meeting(meeting_path, blocks=blocks, dry_run=args.dry_run,
+                                  use_legacy=args.legacy, checkpoint=args.checkpoint,
+                                  batch_blocks=args.batch_blocks)
     else:
-        results = process_queue(batch_size=args.batch_size, blocks=blocks, dry_run=args.dry_run, use_legacy=args.legacy)
+        results = process_queue(batch_size=args.batch_size, blocks=blocks, dry_run=args.dry_run,
+                                use_legacy=args.legacy, checkpoint=args.checkpoint,
+                                batch_blocks=args.batch_blocks)
     
     if args.json:
         print(json.dumps(results, indent=2))
@@ -501,5 +842,4 @@ def main():
 
 
 if __name__ == "__main__":
-    import sys
     sys.exit(main())
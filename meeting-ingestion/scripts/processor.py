@@ -14,19 +14,39 @@ Usage:
 import os
 import sys
 import json
+import mmap
+import time
+import random
+import atexit
+import hashlib
 import argparse
+import functools
+import re
 import logging
+import threading
+import requests
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime, UTC
-from typing import List, Optional, Dict, Any
+from typing import Any, Callable, Dict, List, Optional
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
 
 # Add scripts/scripts to path for imports
 sys.path.insert(0, "./scripts/scripts")
 
-from meeting_manifest_generator import generate_manifest, detect_meeting_type
-from meeting_registry import MeetingRegistry
-from meeting_orchestrator import MeetingOrchestrator
-from meeting_normalizer import parse_folder_name
+# Pipeline modules (manifest generator, normalizer) are imported in
+# process_meeting so --help and argument errors don't pay for loading them
 from meeting_config import MEETINGS_PATH, STAGING_PATH, LOG_PATH
 
 logging.basicConfig(
@@ -40,6 +60,101 @@ MEETINGS_DIR = Path(MEETINGS_PATH)
 STAGING_DIR = Path(STAGING_PATH)
 LOG_FILE = Path(LOG_PATH)
 
+# Per-meeting write-ahead log of generated blocks, kept beside the transcript
+# (see checkpoint_path); reruns skip blocks recorded there
+CHECKPOINT_SUFFIX = ".checkpoint.jsonl"
+_CHECKPOINT_LOCK = threading.Lock()
+
+# Max in-flight Zo API calls across all threads (respects API rate limits)
+API_CONCURRENCY = 8
+_API_SLOTS = threading.BoundedSemaphore(API_CONCURRENCY)
+# Meetings processed at once by process_queue
+QUEUE_CONCURRENCY = 8
+
+# call_zo_api retries rate limits (429), 5xx responses and timeouts with
+# exponential backoff plus jitter, honoring Retry-After; other 4xx fail at once
+API_MAX_ATTEMPTS = 5
+API_RETRY_BASE_DELAY = 1.0
+API_RETRY_MAX_DELAY = 30.0
+_RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# One keep-alive session for every Zo API call. The adapter only retries
+# failed connects; call_zo_api handles response-level retries.
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=32,
+    max_retries=Retry(
+        total=3,
+        read=0,
+        status=0,
+        backoff_factor=0.5,
+        allowed_methods=frozenset({"POST"}),
+        raise_on_status=False
+    )
+))
+atexit.register(_SESSION.close)
+
+# Transcript sent with each prompt: head and tail of long transcripts are kept
+# (decisions and action items cluster at the end). Budget is in tokens when
+# tiktoken is installed, otherwise in characters.
+TRANSCRIPT_TOKEN_BUDGET = 12000
+TRANSCRIPT_CHAR_LIMIT = 30000
+_ELISION_MARKER = "\n\n...[middle of transcript omitted]...\n\n"
+# Transcripts bigger than twice this are read head + tail only (see read_transcript);
+# each edge comfortably exceeds half of either prompt budget
+TRANSCRIPT_EDGE_BYTES = 256 * 1024
+
+# Blocks requested per API call with --llm-batch (keeps output under token limits)
+LLM_BATCH_SIZE = 4
+_JSON_OBJECT_FENCE_RE = re.compile(r"```(?:json)?\s*(\{.*\})\s*```", re.DOTALL)
+
+# Single-block prompts, filled with str.format_map in generate_block
+TEMPLATE_WITH_PROMPT = """{prompt}
+
+## Transcript to Analyze
+{transcript}
+
+## Meeting Context
+{ctx}
+
+## CRITICAL INSTRUCTION
+You MUST output the actual block content directly. Do NOT describe what you would generate. Do NOT output meta-commentary like "Generated B01 block..." or "The recap synthesizes...". 
+Output ONLY the block content itself, starting with the YAML frontmatter (---) and then the markdown body. Begin your response with "---" immediately.
+"""
+
+TEMPLATE_FALLBACK = """Generate the {block_code} intelligence block for this meeting transcript.
+
+## Block Definition
+{block_code}: {block_description}
+
+## Meeting Context
+{ctx}
+
+## Transcript
+{transcript}
+
+## Instructions
+1. Analyze the transcript thoroughly
+2. Extract information relevant to {block_code}
+3. Format the output as clean markdown
+4. Be specific and actionable
+5. Include direct quotes where relevant
+6. For stakeholder intelligence, focus on individual behaviors and patterns
+
+Return ONLY the block content in markdown format, starting with a header."""
+
+# Prompt -> response cache so reprocessing a meeting skips unchanged calls;
+# expired entries are deleted when they are next read
+CACHE_DIR = Path(
+    os.environ.get("ZO_CACHE_DIR")
+    or Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "zo-skills" / "zo-responses"
+)
+CACHE_TTL_SECONDS = 7 * 24 * 3600
+_cache_enabled = True
+
+_PARSER = None
+
 # Block definitions for prompting
 BLOCK_DEFINITIONS = {
     "B01_DETAILED_RECAP": "Comprehensive meeting summary covering all topics discussed, decisions made, and outcomes.",
@@ -76,16 +191,26 @@ BLOCK_SHORT_TO_FULL = {
     "B28": "B28_STRATEGIC_INTELLIGENCE"
 }
 
+# Known full block names, and every accepted spelling (short or full) -> full name
+_ALL_BLOCKS = frozenset(BLOCK_DEFINITIONS)
+_BLOCK_ALIASES = {**{name: name for name in BLOCK_DEFINITIONS}, **BLOCK_SHORT_TO_FULL}
+
+# Shape of a block code, short (B01) or full (B01_DETAILED_RECAP)
+_BLOCK_CODE_RE = re.compile(r"B\d{2}(?:_[A-Z0-9_]+)?")
+
 def normalize_block_code(code: str) -> str:
     """Convert short block code (B01) to full name (B01_DETAILED_RECAP) if needed."""
+    # Codes from manifests are usually already canonical: skip strip/upper
+    full = _BLOCK_ALIASES.get(code)
+    if full is not None:
+        return full
     code = code.strip().upper()
-    if code in BLOCK_SHORT_TO_FULL:
-        return BLOCK_SHORT_TO_FULL[code]
-    return code
+    return _BLOCK_ALIASES.get(code, code)
 
 
+@functools.lru_cache(maxsize=64)
 def load_prompt_file(block_code: str) -> Optional[str]:
-    """Load canonical prompt from Prompts/Blocks/."""
+    """Load canonical prompt from Prompts/Blocks/ (read once per block per run)."""
     # Extract short block code (B01, B05) from full code (B01_DETAILED_RECAP)
     short_code = block_code.split('_')[0] if '_' in block_code else block_code
     prompt_path = Path(f"./Prompts/Blocks/Generate_{short_code}.prompt.md")
@@ -94,11 +219,138 @@ def load_prompt_file(block_code: str) -> Optional[str]:
     return None
 
 
-def call_zo_api(prompt: str, output_format: Optional[dict] = None) -> Any:
+def _utc_now_iso() -> str:
+    """Current UTC time as an ISO-8601 string with a Z suffix, second precision."""
+    return datetime.now(UTC).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _json_loads(data):
+    """Parse JSON bytes or str, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj, indent: bool = False) -> bytes:
+    """Serialize to JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=2 if indent else None).encode("utf-8")
+
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    """Write to a sibling temp file, then rename it over path."""
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
+def _cache_path(prompt: str, output_format: Optional[dict]) -> Path:
+    """Content-addressed cache file for a prompt and output format."""
+    key = hashlib.sha256(
+        (prompt + json.dumps(output_format, sort_keys=True)).encode()
+    ).hexdigest()
+    return CACHE_DIR / f"{key}.json"
+
+
+def _is_cacheable(output: Any) -> bool:
+    """Whether an output is worth caching: not None, empty, or whitespace-only."""
+    if isinstance(output, str):
+        return bool(output.strip())
+    return output is not None and output != {} and output != []
+
+
+def _read_cached(path: Path) -> Optional[Any]:
+    """Return a cached output, or None if missing, expired, empty, or unreadable.
+
+    Expired and empty entries are deleted.
+    """
+    try:
+        if time.time() - path.stat().st_mtime > CACHE_TTL_SECONDS:
+            path.unlink(missing_ok=True)
+            return None
+        output = _json_loads(path.read_bytes())["output"]
+        if not _is_cacheable(output):
+            path.unlink(missing_ok=True)
+            return None
+        return output
+    except (OSError, ValueError, KeyError):
+        return None
+
+
+def _write_cached(path: Path, output: Any) -> None:
+    """Atomically store an output in the cache (best effort)."""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp.write_bytes(_json_dumps({
+            "output": output,
+            "ts": _utc_now_iso()
+        }))
+        os.replace(tmp, path)
+    except OSError as e:
+        logger.warning(f"Could not write response cache {path}: {e}")
+
+
+class TransientAPIError(RuntimeError):
+    """Zo API response worth retrying (rate limit or server error)."""
+
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+def _retry_after_seconds(response) -> Optional[float]:
+    """Seconds from a numeric Retry-After header, if present."""
+    try:
+        return max(0.0, float(response.headers.get("Retry-After", "")))
+    except ValueError:
+        return None
+
+
+def _post_zo_api(token: str, payload: dict) -> Any:
+    """Send one Zo API request, holding an API slot until the body is read."""
+    with _API_SLOTS, _SESSION.post(
+        "<YOUR_WEBHOOK_URL>",
+        headers={
+            "authorization": token,
+            "content-type": "application/json"
+        },
+        data=_json_dumps(payload),
+        timeout=300  # Longer timeout for block generation
+    ) as response:
+        if response.status_code in _RETRYABLE_STATUSES:
+            raise TransientAPIError(
+                f"Zo API error: {response.status_code} - {response.text}",
+                retry_after=_retry_after_seconds(response)
+            )
+        if response.status_code != 200:
+            raise RuntimeError(f"Zo API error: {response.status_code} - {response.text}")
+        
+        return _json_loads(response.content).get("output", "")
+
+
+def call_zo_api(
+    prompt: str,
+    output_format: Optional[dict] = None,
+    refresh: bool = False,
+    accept: Optional[Callable[[Any], bool]] = None
+) -> Any:
     """
     Call Zo API to execute a task.
+    
+    Responses are cached under CACHE_DIR (ZO_CACHE_DIR) for CACHE_TTL_SECONDS,
+    keyed by the prompt and output format; --no-cache bypasses the cache.
+    With refresh set, a cached response is ignored and replaced by the new one.
+    Empty responses are never cached, nor are responses the caller's accept
+    check rejects (e.g. a batched response that doesn't parse).
+    Transient failures are retried up to API_MAX_ATTEMPTS times.
     """
-    import requests
+    cache_file = _cache_path(prompt, output_format) if _cache_enabled else None
+    if cache_file is not None and not refresh:
+        cached = _read_cached(cache_file)
+        if cached is not None:
+            return cached
     
     token = os.environ.get("ZO_CLIENT_IDENTITY_TOKEN")
     if not token:
@@ -108,20 +360,24 @@ def call_zo_api(prompt: str, output_format: Optional[dict] = None) -> Any:
     if output_format:
         payload["output_format"] = output_format
     
-    response = requests.post(
-        "<YOUR_WEBHOOK_URL>",
-        headers={
-            "authorization": token,
-            "content-type": "application/json"
-        },
-        json=payload,
-        timeout=300  # Longer timeout for block generation
-    )
-    
-    if response.status_code != 200:
-        raise RuntimeError(f"Zo API error: {response.status_code} - {response.text}")
+    for attempt in range(1, API_MAX_ATTEMPTS + 1):
+        try:
+            output = _post_zo_api(token, payload)
+            break
+        except (TransientAPIError, requests.Timeout, requests.ConnectionError) as e:
+            if attempt == API_MAX_ATTEMPTS:
+                raise
+            delay = getattr(e, "retry_after", None)
+            if delay is None:
+                delay = API_RETRY_BASE_DELAY * 2 ** (attempt - 1) + random.uniform(0, API_RETRY_BASE_DELAY)
+            delay = min(delay, API_RETRY_MAX_DELAY)
+            # Sleep outside the API slot so other calls can proceed
+            logger.warning(f"Zo API attempt {attempt}/{API_MAX_ATTEMPTS} failed ({e}); retrying in {delay:.1f}s")
+            time.sleep(delay)
     
-    return response.json().get("output", "")
+    if cache_file is not None and _is_cacheable(output) and (accept is None or accept(output)):
+        _write_cached(cache_file, output)
+    return output
 
 
 def find_transcript(meeting_path: Path) -> Optional[Path]:
@@ -132,38 +388,153 @@ def find_transcript(meeting_path: Path) -> Optional[Path]:
     if meeting_path.is_file():
         return meeting_path
     
-    # Look for transcript files
-    transcript_patterns = [
-        "*transcript*.md",
-        "*transcript*.txt",
-        "*.normalized.md",
-        "*.md"
-    ]
-    
-    for pattern in transcript_patterns:
-        files = list(meeting_path.glob(pattern))
-        if files:
-            # Prefer normalized versions
-            normalized = [f for f in files if "normalized" in f.name.lower()]
-            if normalized:
-                return normalized[0]
-            return files[0]
+    # One directory pass, ranking files in order of preference:
+    # *transcript*.md, *transcript*.txt, *.normalized.md, *.md
+    # (within a rank, normalized versions are preferred)
+    best = {}
+    try:
+        entries = os.scandir(meeting_path)
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+    with entries:
+        for entry in entries:
+            name = entry.name
+            if name.startswith(".") or not entry.is_file():
+                continue
+            if "transcript" in name and name.endswith(".md"):
+                rank = 0
+            elif "transcript" in name and name.endswith(".txt"):
+                rank = 1
+            elif name.endswith(".normalized.md"):
+                rank = 2
+            elif name.endswith(".md"):
+                rank = 3
+            else:
+                continue
+            normalized = "normalized" in name.lower()
+            if rank not in best or (normalized and not best[rank][0]):
+                best[rank] = (normalized, entry.path)
+                if rank == 0 and normalized:
+                    break
     
+    if best:
+        return Path(best[min(best)][1])
     return None
 
 
+@functools.lru_cache(maxsize=1)
+def _token_encoder():
+    """Shared tiktoken encoder, or None if tiktoken is unavailable."""
+    if tiktoken is None:
+        return None
+    try:
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception as e:
+        logger.warning(f"tiktoken encoder unavailable, windowing by characters: {e}")
+        return None
+
+
+def read_transcript(transcript_path: Path) -> str:
+    """
+    Read a transcript, skipping the middle of very large files.
+    
+    Only the head and tail can reach a prompt (see window_transcript), so
+    files over 2 * TRANSCRIPT_EDGE_BYTES are mapped and just those edges
+    decoded instead of the whole file.
+    """
+    with open(transcript_path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size <= 2 * TRANSCRIPT_EDGE_BYTES:
+            return f.read().decode("utf-8", errors="replace")
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            head = mm[:TRANSCRIPT_EDGE_BYTES].decode("utf-8", errors="ignore")
+            tail = mm[-TRANSCRIPT_EDGE_BYTES:].decode("utf-8", errors="ignore")
+    return head + _ELISION_MARKER + tail
+
+
+def window_transcript(transcript_text: str) -> str:
+    """
+    Fit a transcript into the prompt budget, keeping its head and tail.
+    
+    Computed once per meeting and shared by every block prompt.
+    """
+    enc = _token_encoder()
+    if enc is not None:
+        tokens = enc.encode(transcript_text)
+        if len(tokens) <= TRANSCRIPT_TOKEN_BUDGET:
+            return transcript_text
+        half = TRANSCRIPT_TOKEN_BUDGET // 2
+        return enc.decode(tokens[:half]) + _ELISION_MARKER + enc.decode(tokens[-half:])
+    
+    if len(transcript_text) <= TRANSCRIPT_CHAR_LIMIT:
+        return transcript_text
+    half = TRANSCRIPT_CHAR_LIMIT // 2
+    return transcript_text[:half] + _ELISION_MARKER + transcript_text[-half:]
+
+
+def checkpoint_path(transcript_path: Path) -> Path:
+    """
+    Checkpoint log for one meeting: a hidden sibling of its transcript.
+    
+    Keyed by the transcript rather than the folder name, so loose transcripts
+    sharing STAGING_DIR each get their own log, and the log moves with the
+    folder through the _[B] rename.
+    """
+    return transcript_path.with_name(f".{transcript_path.name}{CHECKPOINT_SUFFIX}")
+
+
+def load_checkpoint(path: Path) -> set:
+    """Block codes recorded as generated in a meeting's checkpoint log."""
+    done = set()
+    try:
+        with open(path) as f:
+            for line in f:
+                try:
+                    entry = _json_loads(line)
+                except ValueError:
+                    continue  # torn final line from a crash
+                done.add(entry.get("block"))
+    except FileNotFoundError:
+        pass
+    return done
+
+
+def record_checkpoint(path: Path, block_code: str) -> None:
+    """Durably append a generated block to a meeting's checkpoint log."""
+    line = json.dumps({
+        "block": block_code,
+        "ts": _utc_now_iso()
+    }) + "\n"
+    with _CHECKPOINT_LOCK:
+        with open(path, "a") as f:
+            f.write(line)
+            f.flush()
+            os.fsync(f.fileno())
+
+
+def format_meeting_context(meeting_context: dict) -> str:
+    """Render the "Meeting Context" prompt section (once per meeting)."""
+    return (
+        f"- Date: {meeting_context.get('date', 'Unknown')}\n"
+        f"- Participants: {', '.join(meeting_context.get('participants', ['Unknown']))}\n"
+        f"- Meeting Type: {meeting_context.get('meeting_type', 'external')}"
+    )
+
+
 def generate_block(
     transcript_text: str,
     block_code: str,
-    meeting_context: dict
+    context_block: str,
+    refresh: bool = False
 ) -> str:
     """
     Generate a single intelligence block using Zo API.
     
     Args:
-        transcript_text: Full meeting transcript
+        transcript_text: Meeting transcript, already windowed (see window_transcript)
         block_code: Block identifier (e.g., "B01_DETAILED_RECAP")
-        meeting_context: Dict with date, participants, meeting_type
+        context_block: Meeting context section (see format_meeting_context)
+        refresh: Bypass the response cache (see call_zo_api)
     
     Returns:
         Generated block content as markdown
@@ -173,68 +544,179 @@ def generate_block(
     
     if prompt_template:
         # Inject transcript and context into the prompt template
-        prompt = f"""{prompt_template}
+        prompt = TEMPLATE_WITH_PROMPT.format_map({
+            "prompt": prompt_template,
+            "transcript": transcript_text,
+            "ctx": context_block
+        })
+    else:
+        # Fallback to inline definition
+        prompt = TEMPLATE_FALLBACK.format_map({
+            "block_code": block_code,
+            "block_description": BLOCK_DEFINITIONS.get(block_code, "Meeting intelligence block"),
+            "transcript": transcript_text,
+            "ctx": context_block
+        })
 
-## Transcript to Analyze
-{transcript_text[:30000]}
+    result = call_zo_api(prompt, refresh=refresh)
+    return result
 
-## Meeting Context
-- Date: {meeting_context.get('date')}
-- Participants: {', '.join(meeting_context.get('participants', []))}
-- Meeting Type: {meeting_context.get('meeting_type', 'external')}
 
-## CRITICAL INSTRUCTION
-You MUST output the actual block content directly. Do NOT describe what you would generate. Do NOT output meta-commentary like "Generated B01 block..." or "The recap synthesizes...". 
-Output ONLY the block content itself, starting with the YAML frontmatter (---) and then the markdown body. Begin your response with "---" immediately.
-"""
-    else:
-        # Fallback to inline definition
-        block_description = BLOCK_DEFINITIONS.get(block_code, "Meeting intelligence block")
-        prompt = f"""Generate the {block_code} intelligence block for this meeting transcript.
+def _parse_batched_output(output: Any, block_codes: List[str]) -> Dict[str, str]:
+    """Extract {block_code: markdown} from a batched response; unusable entries are omitted."""
+    data = output
+    if isinstance(output, str):
+        try:
+            data = _json_loads(output)
+        except ValueError:
+            match = _JSON_OBJECT_FENCE_RE.search(output)
+            if not match:
+                return {}
+            try:
+                data = _json_loads(match.group(1))
+            except ValueError:
+                return {}
+    
+    if not isinstance(data, dict):
+        return {}
+    return {
+        code: data[code]
+        for code in block_codes
+        if isinstance(data.get(code), str) and data[code].strip()
+    }
 
-## Block Definition
-{block_code}: {block_description}
+
+def generate_blocks_batched(
+    transcript_text: str,
+    block_codes: List[str],
+    context_block: str,
+    refresh: bool = False
+) -> Dict[str, str]:
+    """
+    Generate several intelligence blocks with one Zo API call.
+    
+    Args:
+        transcript_text: Meeting transcript, already windowed (see window_transcript)
+        block_codes: Full block identifiers to generate together
+        context_block: Meeting context section (see format_meeting_context)
+        refresh: Bypass the response cache (see call_zo_api)
+    
+    Returns:
+        Dict of block code -> markdown for the blocks the response contained.
+        Blocks with a canonical prompt must open with YAML frontmatter, as in
+        TEMPLATE_WITH_PROMPT; values without it are omitted so the caller
+        falls back to a single-block call.
+    """
+    sections = []
+    frontmatter_codes = []
+    for block_code in block_codes:
+        instructions = load_prompt_file(block_code)
+        if instructions:
+            frontmatter_codes.append(block_code)
+        else:
+            instructions = f"{block_code}: {BLOCK_DEFINITIONS.get(block_code, 'Meeting intelligence block')}"
+        sections.append(f"### {block_code}\n{instructions}")
+    
+    frontmatter_rule = ""
+    if frontmatter_codes:
+        frontmatter_rule = (
+            f"\nThe values for {', '.join(frontmatter_codes)} MUST each start with the YAML "
+            "frontmatter (---) and then the markdown body: begin each of those values with \"---\"."
+        )
+    
+    prompt = f"""For each of the following blocks, produce its content for this meeting transcript.
+
+## Blocks
+{chr(10).join(sections)}
 
 ## Meeting Context
-- Date: {meeting_context.get('date', 'Unknown')}
-- Participants: {', '.join(meeting_context.get('participants', ['Unknown']))}
-- Meeting Type: {meeting_context.get('meeting_type', 'external')}
+{context_block}
 
 ## Transcript
-{transcript_text[:30000]}  # Truncate very long transcripts
+{transcript_text}
 
-## Instructions
-1. Analyze the transcript thoroughly
-2. Extract information relevant to {block_code}
-3. Format the output as clean markdown
-4. Be specific and actionable
-5. Include direct quotes where relevant
-6. For stakeholder intelligence, focus on individual behaviors and patterns
+## Output Format
+Return strict JSON: an object with keys exactly {', '.join(block_codes)}.
+Each value is that block's actual content as markdown.{frontmatter_rule}
+Do NOT describe what you would generate and do NOT include any text outside the JSON object."""
 
-Return ONLY the block content in markdown format, starting with a header."""
+    output = call_zo_api(
+        prompt,
+        output_format={"type": "json_object"},
+        refresh=refresh,
+        accept=lambda out: bool(_parse_batched_output(out, block_codes))
+    )
+    contents = _parse_batched_output(output, block_codes)
+    for block_code in frontmatter_codes:
+        if block_code in contents and not contents[block_code].lstrip().startswith("---"):
+            logger.warning(f"  Batched {block_code} is missing its frontmatter, regenerating alone")
+            del contents[block_code]
+    return contents
 
-    result = call_zo_api(prompt)
-    return result
+
+def _generate_block_group(
+    transcript_text: str,
+    block_codes: List[str],
+    context_block: str,
+    refresh: bool = False
+) -> Dict[str, Any]:
+    """
+    Generate a group of blocks, batched when there is more than one.
+    
+    Blocks missing from the batched response (or the whole group, if the
+    batched call fails) fall back to single-block calls. Returns block code
+    -> content, or the exception that block failed with.
+    """
+    contents: Dict[str, Any] = {}
+    if len(block_codes) > 1:
+        try:
+            contents = generate_blocks_batched(transcript_text, block_codes, context_block, refresh)
+        except Exception as e:
+            logger.warning(f"  Batched call for {', '.join(block_codes)} failed, falling back: {e}")
+    
+    for block_code in block_codes:
+        if block_code not in contents:
+            try:
+                contents[block_code] = generate_block(transcript_text, block_code, context_block, refresh)
+            except Exception as e:
+                contents[block_code] = e
+    return contents
 
 
 def process_meeting(
     meeting_path: Path,
     blocks: Optional[List[str]] = None,
     skip_crm: bool = False,
-    dry_run: bool = False
+    dry_run: bool = False,
+    llm_batch: int = 1,
+    force: bool = False,
+    processed_at: Optional[str] = None
 ) -> dict:
     """
     Process a single meeting through the full pipeline.
     
+    Blocks recorded in the meeting's checkpoint log (see checkpoint_path) by
+    an earlier, interrupted or partly failed run are kept rather than
+    regenerated, unless force is set. The log is removed once every block
+    has been generated and the manifest written.
+    
     Args:
         meeting_path: Path to meeting folder or transcript file
         blocks: List of block codes to generate (None = auto-detect)
         skip_crm: Skip CRM sync step
         dry_run: Only show what would be done
+        llm_batch: Blocks to request per API call (1 = one call per block)
+        force: Regenerate blocks even if the checkpoint has them, bypassing
+            cached API responses
+        processed_at: Manifest timestamp (default: now); process_queue
+            passes one timestamp for the whole batch
     
     Returns:
         Dict with processing results
     """
+    from meeting_manifest_generator import generate_manifest, detect_meeting_type
+    from meeting_normalizer import parse_folder_name
+    
     logger.info(f"Processing meeting: {meeting_path}")
     
     meeting_dir = meeting_path if meeting_path.is_dir() else meeting_path.parent
@@ -247,7 +729,7 @@ def process_meeting(
     logger.info(f"Using transcript: {transcript_path}")
     
     # Read transcript
-    transcript_text = transcript_path.read_text()
+    transcript_text = read_transcript(transcript_path)
     if len(transcript_text.strip()) < 100:
         raise ValueError(f"Transcript too short ({len(transcript_text)} chars)")
     
@@ -287,28 +769,63 @@ def process_meeting(
         results["dry_run"] = True
         return results
     
-    # Generate blocks
-    for block_code in manifest:
-        # Normalize to full name (B01 -> B01_DETAILED_RECAP)
-        full_block_code = normalize_block_code(block_code)
-        logger.info(f"Generating {full_block_code}...")
+    # Every block prompt shares one windowed transcript and context section
+    windowed = window_transcript(transcript_text)
+    context_block = format_meeting_context(context)
+    
+    # Generate blocks: the API calls are independent, so fan them out (one
+    # call per llm_batch blocks) and write each block file as its result
+    # comes back, in manifest order
+    full_block_codes = [normalize_block_code(block_code) for block_code in manifest]
+    
+    checkpoint_file = checkpoint_path(transcript_path)
+    if not force:
+        done = load_checkpoint(checkpoint_file)
+        remaining = []
+        for full_block_code in full_block_codes:
+            if full_block_code in done and (meeting_dir / f"{full_block_code}.md").exists():
+                logger.info(f"Skipping {full_block_code} (checkpointed)")
+                results["blocks_generated"].append(full_block_code)
+            else:
+                remaining.append(full_block_code)
+        full_block_codes = remaining
+    
+    group_size = max(1, llm_batch)
+    groups = [
+        full_block_codes[i:i + group_size]
+        for i in range(0, len(full_block_codes), group_size)
+    ]
+    with ThreadPoolExecutor(max_workers=max(1, min(API_CONCURRENCY, len(groups)))) as pool:
+        pending = []
+        for group in groups:
+            logger.info(f"Generating {', '.join(group)}...")
+            pending.append((
+                group,
+                pool.submit(_generate_block_group, windowed, group, context_block, force)
+            ))
         
-        try:
-            block_content = generate_block(transcript_text, full_block_code, context)
-            
-            # Write block to file using FULL name
-            block_file = meeting_dir / f"{full_block_code}.md"
-            block_file.write_text(block_content)
-            logger.info(f"  Written: {block_file}")
-            
-            results["blocks_generated"].append(full_block_code)
-            
-        except Exception as e:
-            logger.error(f"  Failed: {e}")
-            results["blocks_failed"].append({
-                "block": full_block_code,
-                "error": str(e)
-            })
+        for group, future in pending:
+            contents = future.result()
+            for full_block_code in group:
+                try:
+                    block_content = contents[full_block_code]
+                    if isinstance(block_content, Exception):
+                        raise block_content
+                    
+                    # Write block to file using FULL name
+                    block_file = meeting_dir / f"{full_block_code}.md"
+                    _atomic_write(block_file, block_content.encode("utf-8"))
+                    logger.info(f"  Written: {block_file}")
+                    record_checkpoint(checkpoint_file, full_block_code)
+                    
+                    results["blocks_generated"].append(full_block_code)
+                    
+                except Exception as e:
+                    logger.error(f"  Failed {full_block_code}: {e}")
+                    results["blocks_failed"].append({
+                        "block": full_block_code,
+                        "error": str(e)
+                    })
     
     # Write manifest
     manifest_file = meeting_dir / "manifest.json"
@@ -318,11 +835,15 @@ def process_meeting(
         "participants": context["participants"],
         "meeting_type": meeting_type,
         "blocks_generated": results["blocks_generated"],
-        "processed_at": datetime.now(UTC).isoformat().replace("+00:00", "Z")
+        "processed_at": processed_at or _utc_now_iso()
     }
-    manifest_file.write_text(json.dumps(manifest_data, indent=2))
+    _atomic_write(manifest_file, _json_dumps(manifest_data, indent=True))
     logger.info(f"Manifest written: {manifest_file}")
     
+    # Keep the checkpoint only while blocks are still missing
+    if not results["blocks_failed"]:
+        checkpoint_file.unlink(missing_ok=True)
+    
     # CRM sync removed - implement your own integration
     
     # Update meeting folder name with status suffix if needed
@@ -331,9 +852,14 @@ def process_meeting(
         new_name = meeting_dir.name + "_[B]"  # Blocked = intelligence blocks generated
         new_path = meeting_dir.parent / new_name
         if not new_path.exists():
-            meeting_dir.rename(new_path)
-            logger.info(f"Renamed to: {new_name}")
-            results["renamed_to"] = str(new_path)
+            try:
+                os.rename(meeting_dir, new_path)
+            except OSError as e:
+                # Target appeared since the check (FileExistsError / not empty)
+                logger.warning(f"Could not rename to {new_name}: {e}")
+            else:
+                logger.info(f"Renamed to: {new_name}")
+                results["renamed_to"] = str(new_path)
     
     return results
 
@@ -342,7 +868,9 @@ def process_queue(
     batch_size: int = 5,
     blocks: Optional[List[str]] = None,
     skip_crm: bool = False,
-    dry_run: bool = False
+    dry_run: bool = False,
+    llm_batch: int = 1,
+    force: bool = False
 ) -> dict:
     """
     Process all meetings in the staging queue.
@@ -352,6 +880,9 @@ def process_queue(
         blocks: Block list to generate (None = auto-detect per meeting)
         skip_crm: Skip CRM sync
         dry_run: Only show what would be done
+        llm_batch: Blocks to request per API call (1 = one call per block)
+        force: Regenerate blocks even if the checkpoint has them, bypassing
+            cached API responses
     
     Returns:
         Dict with overall results
@@ -362,20 +893,25 @@ def process_queue(
         logger.info("Staging directory does not exist")
         return {"processed": 0, "meetings": []}
     
-    # Find meetings to process
-    # Look for .md files directly or folders
-    candidates = []
-    
-    # Direct transcript files
-    for md_file in STAGING_DIR.glob("*.md"):
-        candidates.append(md_file)
+    # Find meetings to process in one pass over the staging directory:
+    # direct transcript files, then folders with a transcript inside.
+    # Folders that already have a manifest.json were processed before.
+    md_files = []
+    folders = []
+    with os.scandir(STAGING_DIR) as entries:
+        for entry in entries:
+            if entry.name.startswith("."):
+                continue
+            if entry.is_file():
+                if entry.name.endswith(".md"):
+                    md_files.append(Path(entry.path))
+            elif entry.is_dir():
+                folders.append(Path(entry.path))
     
-    # Meeting folders (with transcripts inside)
-    for folder in STAGING_DIR.iterdir():
-        if folder.is_dir() and not folder.name.startswith("."):
-            transcript = find_transcript(folder)
-            if transcript:
-                candidates.append(folder)
+    candidates = md_files + [
+        folder for folder in folders
+        if not (folder / "manifest.json").exists() and find_transcript(folder)
+    ]
     
     logger.info(f"Found {len(candidates)} candidates in staging")
     
@@ -386,35 +922,50 @@ def process_queue(
         "meetings": []
     }
     
-    for candidate in candidates[:batch_size]:
-        try:
-            meeting_result = process_meeting(
+    # Meetings are independent; API concurrency is capped globally by _API_SLOTS.
+    # Results are collected here in candidate order, so no locking is needed.
+    batch = candidates[:max(0, batch_size)]
+    batch_ts = _utc_now_iso()
+    with ThreadPoolExecutor(max_workers=max(1, min(len(batch), QUEUE_CONCURRENCY))) as pool:
+        futures = [
+            (candidate, pool.submit(
+                process_meeting,
                 candidate,
                 blocks=blocks,
                 skip_crm=skip_crm,
-                dry_run=dry_run
-            )
-            results["meetings"].append(meeting_result)
-            results["processed"] += 1
-            if not meeting_result.get("blocks_failed"):
-                results["succeeded"] += 1
-            else:
+                dry_run=dry_run,
+                llm_batch=llm_batch,
+                force=force,
+                processed_at=batch_ts
+            ))
+            for candidate in batch
+        ]
+        
+        for candidate, future in futures:
+            try:
+                meeting_result = future.result()
+                results["meetings"].append(meeting_result)
+                results["processed"] += 1
+                if not meeting_result.get("blocks_failed"):
+                    results["succeeded"] += 1
+                else:
+                    results["failed"] += 1
+                    
+            except Exception as e:
+                logger.error(f"Failed to process {candidate}: {e}")
+                results["meetings"].append({
+                    "meeting_path": str(candidate),
+                    "error": str(e)
+                })
+                results["processed"] += 1
                 results["failed"] += 1
-                
-        except Exception as e:
-            logger.error(f"Failed to process {candidate}: {e}")
-            results["meetings"].append({
-                "meeting_path": str(candidate),
-                "error": str(e)
-            })
-            results["processed"] += 1
-            results["failed"] += 1
     
     logger.info(f"Queue processing complete: {results['succeeded']}/{results['processed']} succeeded")
     return results
 
 
-def main():
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the CLI parser (once per process; see main)."""
     parser = argparse.ArgumentParser(
         description="Process meeting transcripts through intelligence pipeline"
     )
@@ -449,17 +1000,45 @@ def main():
         action="store_true",
         help="Output results as JSON"
     )
+    parser.add_argument(
+        "--llm-batch",
+        type=int,
+        default=LLM_BATCH_SIZE,
+        help=f"Blocks to generate per API call; 1 disables batching (default: {LLM_BATCH_SIZE})"
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Regenerate blocks already recorded in the checkpoint, ignoring cached API responses"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always call the Zo API, ignoring cached responses"
+    )
+    return parser
+
+
+def main(argv=None):
+    global _PARSER, _cache_enabled
+    if _PARSER is None:
+        _PARSER = _build_parser()
+    
+    args = _PARSER.parse_args(argv)
     
-    args = parser.parse_args()
+    _cache_enabled = not args.no_cache
     
     # Parse blocks
     blocks = None
     if args.blocks:
         blocks = [normalize_block_code(b) for b in args.blocks.split(",")]
+        malformed = [b for b in blocks if not _BLOCK_CODE_RE.fullmatch(b)]
+        if malformed:
+            _PARSER.error(f"malformed block codes: {', '.join(malformed)} (expected e.g. B01 or B01_DETAILED_RECAP)")
         # Validate blocks
-        for b in blocks:
-            if b not in BLOCK_DEFINITIONS:
-                logger.warning(f"Unknown block: {b}")
+        unknown = [b for b in blocks if b not in _ALL_BLOCKS]
+        if unknown:
+            logger.warning(f"Unknown blocks: {', '.join(unknown)}")
     
     try:
         if args.meeting_path:
@@ -472,7 +1051,9 @@ def main():
                 meeting_path,
                 blocks=blocks,
                 skip_crm=args.skip_crm,
-                dry_run=args.dry_run
+                dry_run=args.dry_run,
+                llm_batch=args.llm_batch,
+                force=args.force
             )
         else:
             # Process staging queue
@@ -480,7 +1061,9 @@ def main():
                 batch_size=args.batch_size,
                 blocks=blocks,
                 skip_crm=args.skip_crm,
-                dry_run=args.dry_run
+                dry_run=args.dry_run,
+                llm_batch=args.llm_batch,
+                force=args.force
             )
         
         if args.json:
@@ -12,14 +12,32 @@ Usage:
 import os
 import sys
 import json
-import yaml
+import time
+import atexit
+import functools
 import argparse
 import logging
+import queue
+import requests
+import shutil
+import socket
 import subprocess
 import tempfile
+import threading
+import base64
 import re
+import sqlite3
+from logging.handlers import QueueHandler, QueueListener
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 from pathlib import Path
 from datetime import datetime, UTC
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Add scripts/scripts to path for imports
 sys.path.insert(0, "./scripts/scripts")
@@ -28,10 +46,22 @@ from meeting_registry import MeetingRegistry
 from meeting_normalizer import normalize_date, normalize_participants, generate_meeting_id
 from meeting_config import STAGING_PATH, LOG_PATH
 
+# Records are queued by the calling thread and formatted/written on a
+# background listener, so pool workers never block on stderr. If logging
+# was already configured by an importer, its handlers are used instead.
+_log_queue = queue.SimpleQueue()
+_log_handler = logging.StreamHandler()
+_log_handler.setFormatter(logging.Formatter("%(asctime)sZ %(levelname)s %(message)s"))
+_queue_handler = QueueHandler(_log_queue)
+_queue_handler.setFormatter(logging.Formatter("%(message)s"))
 logging.basicConfig(
     level=logging.INFO,
-    format="%(asctime)sZ %(levelname)s %(message)s"
+    handlers=[_queue_handler]
 )
+if _queue_handler in logging.getLogger().handlers:
+    _log_listener = QueueListener(_log_queue, _log_handler)
+    _log_listener.start()
+    atexit.register(_log_listener.stop)
 logger = logging.getLogger(__name__)
 
 # Paths
@@ -39,12 +69,104 @@ CONFIG_PATH = Path("./scripts/config/drive_locations.yaml")
 STAGING_DIR = Path(STAGING_PATH)
 LOG_DIR = Path(LOG_PATH)
 
+# Drive file IDs already staged, so a renamed or re-dated Drive file is still
+# recognised without comparing filenames (see _open_staging_index)
+STAGING_INDEX = STAGING_DIR / ".index.sqlite"
+STAGING_INDEX_COMMIT_EVERY = 50
+
+# Files downloaded/converted at once (each holds a Zo API call or pandoc run)
+PULL_CONCURRENCY = int(os.environ.get("PULL_CONCURRENCY", "6"))
+
+# Transcript formats pulled from Drive
+SUPPORTED_EXTENSIONS = (".docx", ".doc", ".txt", ".md")
+SUPPORTED_MIME_TYPES = frozenset({
+    "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+    "application/vnd.google-apps.document",
+    "text/plain",
+    "text/markdown"
+})
+
+# One keep-alive session for every Zo API call (thread-safe for concurrent posts).
+# The adapter only retries failed connects: a read timeout or gateway error may
+# mean Zo is still running the prompt, and resending would start a duplicate
+# download. The pool keeps a connection per worker so high PULL_CONCURRENCY
+# doesn't churn them.
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=max(16, PULL_CONCURRENCY),
+    max_retries=Retry(
+        total=3,
+        read=0,
+        status=0,
+        backoff_factor=0.3,
+        allowed_methods=frozenset({"POST"}),
+        raise_on_status=False
+    )
+))
+atexit.register(_SESSION.close)
+
+# .docx conversion goes through one long-lived `pandoc server` (pandoc >= 2.18)
+# so each file doesn't pay pandoc's startup; PANDOC_SERVER=0, or a pandoc
+# without server mode, falls back to one `pandoc` process per file
+PANDOC_SERVER_ENABLED = os.environ.get("PANDOC_SERVER", "1") != "0"
+PANDOC_SERVER_TIMEOUT = 60
+PANDOC_SERVER_START_TIMEOUT = 5
+_pandoc_server_url = None
+_pandoc_server_failed = False
+_PANDOC_SERVER_LOCK = threading.Lock()
+
+# Drive listings are cached on disk briefly so a dry run followed by a real
+# run (or repeated runs while iterating) doesn't re-list; --no-cache skips it
+LISTING_CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "zo-skills" / "drive-list"
+LISTING_CACHE_TTL = 300
+_listing_cache_enabled = True
+
+# Zo response parsing (see parse_file_list_from_text / list_drive_files_multi)
+_JSON_FENCE_RE = re.compile(r'```(?:json)?\s*([\[{][\s\S]*?[\]}])\s*```')
+_TABLE_ROW_RE = re.compile(r'\|\s*([^\|]+)\s*\|\s*([^\|]+)\s*\|\s*([^\|]+)\s*\|')
+_LINE_DASH_ID_RE = re.compile(r'[\-\*]\s*(.+?)\s*\((?:ID|id|Id):\s*([^\)]+)\)')
+_ID_KV_RE = re.compile(r'(?:ID|id|Id|fileId):\s*([^\s,]+)')
+_NAME_KV_RE = re.compile(r'(?:Name|name|fileName):\s*([^\s,]+)')
+
+# Filename metadata extraction (see extract_meeting_metadata)
+_DATE_RES = (
+    re.compile(r'(\d{4}-\d{2}-\d{2})'),  # 2025-01-15
+    re.compile(r'(\d{4}\d{2}\d{2})'),     # 20250115
+    re.compile(r'(\d{2}/\d{2}/\d{4})'),   # 01/15/2025
+)
+_DATE_STRIP_RE = re.compile(r'\d{4}[-/]?\d{2}[-/]?\d{2}')
+_EXT_STRIP_RE = re.compile(r'\.(docx|txt|md|doc)$', re.IGNORECASE)
+_PREFIX_RE = re.compile(r'^(Meeting|Call|Sync|Notes?)[\s_-]*', re.IGNORECASE)
+_SUFFIX_RE = re.compile(r'[\s_-]*(Meeting|Call|Sync|Notes?)$', re.IGNORECASE)
+_NAME_SPLIT_RE = re.compile(r'[_\-\s]+')
+
+# Many files share a meeting date, so normalised dates are memoised
+_norm_date = functools.lru_cache(maxsize=4096)(normalize_date)
+
+
+def _json_loads(data):
+    """Parse JSON bytes or str, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj) -> bytes:
+    """Serialize to indented JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode("utf-8")
+
 
 def load_drive_config() -> dict:
     """Load Google Drive folder configuration."""
     if not CONFIG_PATH.exists():
         raise FileNotFoundError(f"Drive config not found: {CONFIG_PATH}")
     
+    # Only needed once a config exists, so --help and early errors skip it
+    import yaml
+    
     with open(CONFIG_PATH) as f:
         config = yaml.safe_load(f)
     
@@ -56,13 +178,11 @@ def call_zo_api(prompt: str) -> str:
     Call Zo API to execute a task.
     Returns the text response (no structured output).
     """
-    import requests
-    
     token = os.environ.get("ZO_CLIENT_IDENTITY_TOKEN")
     if not token:
         raise RuntimeError("ZO_CLIENT_IDENTITY_TOKEN not set")
     
-    response = requests.post(
+    with _SESSION.post(
         "<YOUR_WEBHOOK_URL>",
         headers={
             "authorization": token,
@@ -73,12 +193,57 @@ def call_zo_api(prompt: str) -> str:
             # No output_format - we'll parse text response
         },
         timeout=180
-    )
-    
-    if response.status_code != 200:
-        raise RuntimeError(f"Zo API error: {response.status_code} - {response.text}")
-    
-    return response.json().get("output", "")
+    ) as response:
+        if response.status_code != 200:
+            raise RuntimeError(f"Zo API error: {response.status_code} - {response.text}")
+        
+        return _json_loads(response.content).get("output", "")
+
+
+def _file_records(items: list) -> list:
+    """Normalize JSON file entries from Zo into file metadata dicts."""
+    return [
+        {
+            'id': item.get('id') or item.get('fileId'),
+            'name': item.get('name') or item.get('fileName', 'unknown'),
+            'mimeType': item.get('mimeType', 'unknown'),
+            'createdTime': item.get('createdTime', '')
+        }
+        for item in items
+        if isinstance(item, dict) and ('id' in item or 'fileId' in item)
+    ]
+
+
+def _json_array_span(text: str) -> str | None:
+    """
+    Return the first balanced [...] span in text, starting after a "files"
+    key when there is one. Brackets inside JSON strings are ignored.
+    """
+    start = text.find("[", max(text.find('"files"'), 0))
+    if start < 0:
+        return None
+    
+    depth = 0
+    in_string = False
+    escaped = False
+    for i in range(start, len(text)):
+        ch = text[i]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif ch == "\\":
+                escaped = True
+            elif ch == '"':
+                in_string = False
+        elif ch == '"':
+            in_string = True
+        elif ch == "[":
+            depth += 1
+        elif ch == "]":
+            depth -= 1
+            if depth == 0:
+                return text[start:i + 1]
+    return None
 
 
 def parse_file_list_from_text(text: str) -> list:
@@ -90,49 +255,46 @@ def parse_file_list_from_text(text: str) -> list:
     - | file_id | name | mimeType |
     - JSON blocks with file arrays
     """
-    files = []
-    
-    # Try to find JSON in the response
-    json_match = re.search(r'\[[\s\S]*?\]', text)
-    if json_match:
+    # Try to find JSON in the response: a fenced block first, then the
+    # first bracketed array
+    fenced = _JSON_FENCE_RE.search(text)
+    json_text = fenced.group(1) if fenced else _json_array_span(text)
+    if json_text:
         try:
-            parsed = json.loads(json_match.group())
+            parsed = _json_loads(json_text)
+            if isinstance(parsed, dict):
+                parsed = parsed.get("files")
             if isinstance(parsed, list):
-                for item in parsed:
-                    if isinstance(item, dict) and ('id' in item or 'fileId' in item):
-                        files.append({
-                            'id': item.get('id') or item.get('fileId'),
-                            'name': item.get('name') or item.get('fileName', 'unknown'),
-                            'mimeType': item.get('mimeType', 'unknown'),
-                            'createdTime': item.get('createdTime', '')
-                        })
+                files = _file_records(parsed)
                 if files:
                     return files
-        except json.JSONDecodeError:
+        except ValueError:
             pass
     
-    # Try markdown table format
-    table_rows = re.findall(r'\|\s*([^\|]+)\s*\|\s*([^\|]+)\s*\|\s*([^\|]+)\s*\|', text)
-    for row in table_rows:
-        # Skip header rows
-        if 'id' in row[0].lower() or '---' in row[0]:
+    # One pass over the lines: cheap substring probes decide which (if any)
+    # pattern runs. Table rows win over the line formats, as before.
+    table_files = []
+    line_files = []
+    for line in text.splitlines():
+        if "|" in line:
+            # Markdown table row: | file_id | name | mimeType |
+            row = _TABLE_ROW_RE.search(line)
+            # Skip header rows
+            if row and 'id' not in row.group(1).lower() and '---' not in row.group(1):
+                table_files.append({
+                    'id': row.group(1).strip(),
+                    'name': row.group(2).strip(),
+                    'mimeType': row.group(3).strip(),
+                    'createdTime': ''
+                })
+        
+        if table_files or ("d:" not in line and "D:" not in line):
             continue
-        files.append({
-            'id': row[0].strip(),
-            'name': row[1].strip(),
-            'mimeType': row[2].strip() if len(row) > 2 else 'unknown',
-            'createdTime': ''
-        })
-    
-    if files:
-        return files
-    
-    # Try line-by-line parsing
-    for line in text.split('\n'):
+        
         # Pattern: "- filename.docx (ID: xxx)"
-        match = re.search(r'[\-\*]\s*(.+?)\s*\((?:ID|id|Id):\s*([^\)]+)\)', line)
+        match = _LINE_DASH_ID_RE.search(line)
         if match:
-            files.append({
+            line_files.append({
                 'id': match.group(2).strip(),
                 'name': match.group(1).strip(),
                 'mimeType': 'unknown',
@@ -141,17 +303,17 @@ def parse_file_list_from_text(text: str) -> list:
             continue
         
         # Pattern: "ID: xxx, Name: yyy"
-        id_match = re.search(r'(?:ID|id|Id|fileId):\s*([^\s,]+)', line)
-        name_match = re.search(r'(?:Name|name|fileName):\s*([^\s,]+)', line)
-        if id_match and name_match:
-            files.append({
+        id_match = _ID_KV_RE.search(line)
+        name_match = id_match and _NAME_KV_RE.search(line)
+        if name_match:
+            line_files.append({
                 'id': id_match.group(1).strip(),
                 'name': name_match.group(1).strip(),
                 'mimeType': 'unknown',
                 'createdTime': ''
             })
     
-    return files
+    return table_files or line_files
 
 
 def list_drive_files(folder_id: str) -> list:
@@ -187,6 +349,91 @@ List ALL files in the folder. If there are no files, say "No files found."
     return files
 
 
+def _read_listing_cache(folder_id: str):
+    """Cached file list for a folder, or None if missing or older than the TTL."""
+    cache_path = LISTING_CACHE_DIR / f"{folder_id}.json"
+    try:
+        if time.time() - cache_path.stat().st_mtime >= LISTING_CACHE_TTL:
+            return None
+        return _json_loads(cache_path.read_bytes())
+    except (OSError, ValueError):
+        return None
+
+
+def _write_listing_cache(folder_id: str, files: list) -> None:
+    """Store a folder's file list (best effort)."""
+    cache_path = LISTING_CACHE_DIR / f"{folder_id}.json"
+    try:
+        LISTING_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp = cache_path.with_suffix(".json.tmp")
+        tmp.write_bytes(_json_dumps(files))
+        os.replace(tmp, cache_path)
+    except OSError as e:
+        logger.warning(f"Could not cache Drive listing for {folder_id}: {e}")
+
+
+@functools.lru_cache(maxsize=None)
+def list_drive_files_multi(folder_ids: tuple) -> dict:
+    """
+    List files in several Google Drive folders.
+    
+    Folders listed within LISTING_CACHE_TTL seconds come from the disk cache;
+    the rest are listed with one Zo API call. Returns
+    {folder_id: [file metadata dicts]}; memoized for the run.
+    """
+    listing = {}
+    if _listing_cache_enabled:
+        for folder_id in folder_ids:
+            cached = _read_listing_cache(folder_id)
+            if cached is not None:
+                logger.info(f"Using cached listing for {folder_id}")
+                listing[folder_id] = cached
+    
+    uncached = tuple(folder_id for folder_id in folder_ids if folder_id not in listing)
+    if uncached:
+        fresh = _list_folders(uncached)
+        for folder_id, files in fresh.items():
+            _write_listing_cache(folder_id, files)
+        listing.update(fresh)
+    return listing
+
+
+def _list_folders(folder_ids: tuple) -> dict:
+    """List files in one or more folders with a single Zo API call."""
+    if len(folder_ids) == 1:
+        return {folder_ids[0]: list_drive_files(folder_ids[0])}
+    
+    folder_lines = "\n".join(f"- {folder_id}" for folder_id in folder_ids)
+    prompt = f"""List all files in each of these Google Drive folders (by folder ID):
+{folder_lines}
+
+Use use_app_google_drive with the google_drive-list-files-in-folder tool, once per folder.
+
+Output ONLY a fenced ```json block containing an array with one entry per folder:
+[{{"folder_id": "FOLDER_ID", "files": [{{"id": "FILE_ID", "name": "FILENAME", "mimeType": "MIME_TYPE"}}]}}]
+
+Include every folder listed above, using an empty "files" array for empty folders.
+"""
+
+    result = call_zo_api(prompt)
+    
+    fenced = _JSON_FENCE_RE.search(result)
+    try:
+        parsed = _json_loads(fenced.group(1) if fenced else result)
+    except ValueError:
+        parsed = None
+    
+    if not isinstance(parsed, list):
+        logger.warning(f"Could not parse multi-folder listing, listing folders one by one: {result[:500]}")
+        return {folder_id: list_drive_files(folder_id) for folder_id in folder_ids}
+    
+    listing = {folder_id: [] for folder_id in folder_ids}
+    for entry in parsed:
+        if isinstance(entry, dict) and entry.get("folder_id") in listing:
+            listing[entry["folder_id"]].extend(_file_records(entry.get("files") or []))
+    return listing
+
+
 def download_drive_file(file_id: str, file_name: str, dest_path: Path) -> Path:
     """
     Download a file from Google Drive via Zo API.
@@ -194,7 +441,7 @@ def download_drive_file(file_id: str, file_name: str, dest_path: Path) -> Path:
     """
     # Determine export format for Google Docs
     export_note = ""
-    if "google-apps" in file_name.lower() or not any(file_name.lower().endswith(ext) for ext in ['.docx', '.txt', '.md', '.doc']):
+    if "google-apps" in file_name.lower() or not file_name.lower().endswith(SUPPORTED_EXTENSIONS):
         export_note = """
 If this is a Google Doc (not a regular file), export it as:
 - mimeType: application/vnd.openxmlformats-officedocument.wordprocessingml.document
@@ -230,48 +477,116 @@ If failed, respond with: FAILED: [reason]
         if p.exists():
             if p != dest_path:
                 # Move to expected location
-                import shutil
                 shutil.move(str(p), str(dest_path))
             return dest_path
     
-    # Try to find by name pattern
-    for p in dest_path.parent.glob(f"*{Path(file_name).stem}*"):
-        if p.is_file():
-            import shutil
-            shutil.move(str(p), str(dest_path))
-            return dest_path
+    # Try to find by name (case-insensitive substring of the stem)
+    stem = Path(file_name).stem.lower()
+    with os.scandir(dest_path.parent) as entries:
+        for entry in entries:
+            if stem in entry.name.lower() and entry.is_file(follow_symlinks=False):
+                shutil.move(entry.path, str(dest_path))
+                return dest_path
     
     raise FileNotFoundError(f"Download completed but file not found. Response: {result[:200]}")
 
 
-def convert_to_markdown(source_path: Path) -> Path:
+def _pandoc_server() -> str | None:
     """
-    Convert document to markdown using pandoc.
-    Returns path to converted file.
+    Return the URL of this run's pandoc server, starting it on first use.
+    Returns None if server mode is disabled or pandoc can't serve.
     """
-    output_path = source_path.with_suffix(".md")
-    
-    cmd = [
-        "pandoc",
-        "-f", "docx",
-        "-t", "markdown",
-        "-o", str(output_path),
-        str(source_path)
-    ]
-    
-    result = subprocess.run(cmd, capture_output=True, text=True)
+    global _pandoc_server_url, _pandoc_server_failed
     
-    if result.returncode != 0:
-        raise RuntimeError(f"Pandoc conversion failed: {result.stderr}")
+    with _PANDOC_SERVER_LOCK:
+        if _pandoc_server_url or _pandoc_server_failed or not PANDOC_SERVER_ENABLED:
+            return _pandoc_server_url
+        
+        # Let the OS pick a free local port
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            port = sock.getsockname()[1]
+        
+        try:
+            proc = subprocess.Popen(
+                ["pandoc", "server", "--port", str(port), "--timeout", str(PANDOC_SERVER_TIMEOUT)],
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL
+            )
+        except OSError as e:
+            logger.warning(f"pandoc server unavailable, converting per file: {e}")
+            _pandoc_server_failed = True
+            return None
+        
+        url = f"http://127.0.0.1:{port}/"
+        deadline = time.monotonic() + PANDOC_SERVER_START_TIMEOUT
+        while True:
+            if proc.poll() is not None:
+                logger.warning("pandoc server exited on startup, converting per file")
+                _pandoc_server_failed = True
+                return None
+            try:
+                with _SESSION.get(url + "version", timeout=1) as response:
+                    if response.ok:
+                        break
+            except requests.ConnectionError:
+                pass
+            if time.monotonic() > deadline:
+                proc.kill()
+                logger.warning("pandoc server did not start in time, converting per file")
+                _pandoc_server_failed = True
+                return None
+            time.sleep(0.05)
+        
+        atexit.register(proc.terminate)
+        _pandoc_server_url = url
+        return url
+
+
+def convert_to_markdown(source: bytes) -> bytes:
+    """
+    Convert a .docx document to markdown using pandoc.
+    The document is posted to the shared pandoc server, or piped through a
+    pandoc process's stdin/stdout if there is none, so no intermediate
+    files are written. Returns the markdown bytes.
+    """
+    output = None
+    
+    url = _pandoc_server()
+    if url:
+        payload = {
+            "text": base64.b64encode(source).decode("ascii"),
+            "from": "docx",
+            "to": "markdown"
+        }
+        try:
+            with _SESSION.post(url, json=payload, headers={"Accept": "text/plain"},
+                               timeout=PANDOC_SERVER_TIMEOUT + 5) as response:
+                if not response.ok:
+                    raise RuntimeError(f"Pandoc conversion failed: {response.text}")
+                output = response.content
+        except requests.RequestException as e:
+            logger.warning(f"pandoc server request failed, converting with pandoc CLI: {e}")
+    
+    if output is None:
+        cmd = [
+            "pandoc",
+            "-f", "docx",
+            "-t", "markdown"
+        ]
+        
+        result = subprocess.run(cmd, input=source, capture_output=True)
+        
+        if result.returncode != 0:
+            raise RuntimeError(f"Pandoc conversion failed: {result.stderr.decode(errors='replace')}")
+        output = result.stdout
     
     # Validate output
-    if not output_path.exists():
-        raise FileNotFoundError(f"Conversion output not found: {output_path}")
-    
-    if output_path.stat().st_size == 0:
-        raise ValueError(f"Conversion produced empty file: {output_path}")
+    if not output.strip():
+        raise ValueError("Conversion produced empty output")
     
-    return output_path
+    return output
 
 
 def extract_meeting_metadata(file_name: str) -> dict:
@@ -284,18 +599,12 @@ def extract_meeting_metadata(file_name: str) -> dict:
     - "Meeting_2025-01-15_Participants.docx"
     """
     # Try to extract date
-    date_patterns = [
-        r'(\d{4}-\d{2}-\d{2})',  # 2025-01-15
-        r'(\d{4}\d{2}\d{2})',     # 20250115
-        r'(\d{2}/\d{2}/\d{4})',   # 01/15/2025
-    ]
-    
     date = None
-    for pattern in date_patterns:
-        match = re.search(pattern, file_name)
+    for pattern in _DATE_RES:
+        match = pattern.search(file_name)
         if match:
             try:
-                date = normalize_date(match.group(1))
+                date = _norm_date(match.group(1))
                 break
             except ValueError:
                 continue
@@ -303,13 +612,13 @@ def extract_meeting_metadata(file_name: str) -> dict:
     # Extract potential participant names
     # Remove date, extension, common prefixes
     name_part = file_name
-    name_part = re.sub(r'\d{4}[-/]?\d{2}[-/]?\d{2}', '', name_part)
-    name_part = re.sub(r'\.(docx|txt|md|doc)$', '', name_part, flags=re.IGNORECASE)
-    name_part = re.sub(r'^(Meeting|Call|Sync|Notes?)[\s_-]*', '', name_part, flags=re.IGNORECASE)
-    name_part = re.sub(r'[\s_-]*(Meeting|Call|Sync|Notes?)$', '', name_part, flags=re.IGNORECASE)
+    name_part = _DATE_STRIP_RE.sub('', name_part)
+    name_part = _EXT_STRIP_RE.sub('', name_part)
+    name_part = _PREFIX_RE.sub('', name_part)
+    name_part = _SUFFIX_RE.sub('', name_part)
     
     # Split on common separators and filter
-    potential_names = re.split(r'[_\-\s]+', name_part)
+    potential_names = _NAME_SPLIT_RE.split(name_part)
     participants = [n.strip() for n in potential_names if len(n.strip()) > 2]
     
     return {
@@ -319,6 +628,86 @@ def extract_meeting_metadata(file_name: str) -> dict:
     }
 
 
+def _fast_stage(src: Path, dst: Path) -> None:
+    """
+    Place src at dst without copying bytes where the filesystem allows:
+    a hardlink when both are on one filesystem, then an in-kernel
+    copy_file_range (reflinks on btrfs/XFS), then shutil.copy2.
+    """
+    try:
+        os.link(src, dst)
+        return
+    except OSError:
+        pass
+    
+    if hasattr(os, "copy_file_range"):
+        try:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+            if remaining == 0:
+                shutil.copystat(src, dst)
+                return
+        except OSError:
+            pass
+    
+    shutil.copy2(src, dst)
+
+
+def stage_file(file_id: str, file_name: str, dest_path: Path) -> Path:
+    """
+    Download one Drive file and place it in staging at dest_path, converting
+    it to markdown first if needed. Returns dest_path.
+    """
+    # Text-native transcripts need no conversion: download into a private
+    # hidden dir inside staging (same filesystem) and rename into place. The
+    # private dir also keeps download_drive_file's find-by-name fallback from
+    # ever matching another staged transcript.
+    text_native = Path(file_name).suffix.lower() in (".md", ".txt")
+    tmp_parent = dest_path.parent if text_native else None
+    
+    with tempfile.TemporaryDirectory(dir=tmp_parent, prefix=".pull-") as tmpdir:
+        tmp_path = Path(tmpdir) / file_name
+        logger.info(f"  Downloading to: {tmp_path}")
+        downloaded = download_drive_file(file_id, file_name, tmp_path)
+        
+        if text_native:
+            os.replace(downloaded, dest_path)
+        # Convert to markdown if needed, writing pandoc's output straight
+        # to staging (hidden temp name until complete)
+        elif downloaded.suffix.lower() in [".docx", ".doc"]:
+            logger.info(f"  Converting to markdown: {file_name}")
+            markdown = convert_to_markdown(downloaded.read_bytes())
+            tmp_dest = dest_path.with_name(f".{dest_path.name}.tmp")
+            tmp_dest.write_bytes(markdown)
+            os.replace(tmp_dest, dest_path)
+        else:
+            _fast_stage(downloaded, dest_path)
+        logger.info(f"  Staged: {dest_path}")
+    
+    return dest_path
+
+
+def _open_staging_index() -> sqlite3.Connection:
+    """Open (creating if needed) the staging index of Drive files already pulled."""
+    conn = sqlite3.connect(STAGING_INDEX)
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS staged (
+            gdrive_id TEXT PRIMARY KEY,
+            file TEXT,
+            dest TEXT,
+            staged_at TEXT
+        )
+        """
+    )
+    return conn
+
+
 def pull_transcripts(
     dry_run: bool = False,
     batch_size: int = 5
@@ -326,48 +715,40 @@ def pull_transcripts(
     """
     Main pull function.
     
+    Up to PULL_CONCURRENCY files are downloaded and converted at once. A
+    file that fails frees its slot for the next one, so up to batch_size
+    files are staged as before.
+    
     Returns:
         dict with keys: ingested, skipped, errors
     """
     logger.info(f"Starting transcript pull (dry_run={dry_run}, batch_size={batch_size})")
     
-    # Load config
+    # Load config; transcripts_inbox may be one folder ID or a list of them
     config = load_drive_config()
-    folder_id = config.get("meetings", {}).get("transcripts_inbox")
+    inbox = config.get("meetings", {}).get("transcripts_inbox")
+    folder_ids = tuple(inbox) if isinstance(inbox, list) else (inbox,) if inbox else ()
     
-    if not folder_id:
+    if not folder_ids:
         raise ValueError("meetings.transcripts_inbox not configured in drive_locations.yaml")
     
-    logger.info(f"Drive folder ID: {folder_id}")
+    logger.info(f"Drive folder ID(s): {', '.join(folder_ids)}")
     
     # Initialize registry
     registry = MeetingRegistry()
     
-    # List files in Drive
-    logger.info("Listing files in Drive folder...")
-    files = list_drive_files(folder_id)
+    # List files in Drive (one Zo call covers every folder)
+    logger.info("Listing files in Drive...")
+    listing = list_drive_files_multi(folder_ids)
+    files = [f for folder_id in folder_ids for f in listing[folder_id]]
     logger.info(f"Found {len(files)} files in Drive")
     
-    # Filter to supported types
-    supported_extensions = ['.docx', '.doc', '.txt', '.md']
-    supported_mime_types = [
-        "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-        "application/vnd.google-apps.document",
-        "text/plain",
-        "text/markdown"
+    # Filter to supported types (by extension or mime type)
+    files = [
+        f for f in files
+        if (f.get('name') or '').lower().endswith(SUPPORTED_EXTENSIONS)
+        or f.get('mimeType', '') in SUPPORTED_MIME_TYPES
     ]
-    
-    filtered_files = []
-    for f in files:
-        name = f.get('name', '')
-        mime = f.get('mimeType', '')
-        # Check by extension or mime type
-        if any(name.lower().endswith(ext) for ext in supported_extensions):
-            filtered_files.append(f)
-        elif mime in supported_mime_types:
-            filtered_files.append(f)
-    
-    files = filtered_files
     logger.info(f"{len(files)} files are supported transcript formats")
     
     # Ensure staging dir exists
@@ -380,87 +761,132 @@ def pull_transcripts(
     }
     
     processed = 0
-    for file_info in files:
-        if processed >= batch_size:
-            logger.info(f"Reached batch size limit ({batch_size})")
-            break
-        
-        file_id = file_info.get("id")
-        file_name = file_info.get("name")
-        
-        if not file_id or not file_name:
-            logger.warning(f"Skipping file with missing id or name: {file_info}")
-            continue
-        
-        logger.info(f"Processing: {file_name}")
-        
-        try:
-            # Check if already in registry (by filename since we don't track gdrive_id)
-            # This is a simple dedup check
-            existing_files = list(STAGING_DIR.glob(f"*{Path(file_name).stem}*"))
-            if existing_files:
-                logger.info(f"  Skipped: similar file already in staging")
-                results["skipped"].append({
-                    "file": file_name,
-                    "reason": "similar_file_exists"
-                })
-                continue
-            
-            # Extract metadata
-            metadata = extract_meeting_metadata(file_name)
-            
-            if dry_run:
-                logger.info(f"  Would ingest: {file_name}")
-                logger.info(f"    Date: {metadata.get('date', 'unknown')}")
-                logger.info(f"    Participants: {metadata.get('participants', [])}")
-                results["ingested"].append({
-                    "file": file_name,
-                    "metadata": metadata,
-                    "dry_run": True
-                })
-                processed += 1
-                continue
-            
-            # Download file
-            with tempfile.TemporaryDirectory() as tmpdir:
-                tmp_path = Path(tmpdir) / file_name
-                logger.info(f"  Downloading to: {tmp_path}")
-                downloaded = download_drive_file(file_id, file_name, tmp_path)
+    pending = {}          # future -> (file_id, file_name, dest_name, metadata)
+    # Names already in staging plus files in flight this run; read once
+    # instead of globbing the staging directory for every file
+    with os.scandir(STAGING_DIR) as entries:
+        staged_names = {entry.name for entry in entries if not entry.name.startswith(".")}
+    remaining = iter(files)
+    
+    # Drive IDs staged by earlier runs; new rows are committed in batches
+    index = _open_staging_index()
+    indexed_ids = {row[0] for row in index.execute("SELECT gdrive_id FROM staged")}
+    uncommitted = 0
+    
+    with index, ThreadPoolExecutor(max_workers=max(1, PULL_CONCURRENCY)) as pool:
+        while True:
+            # Dedup checks and submission stay on this thread; only the
+            # download/convert/copy work runs in the pool
+            while processed + len(pending) < batch_size:
+                file_info = next(remaining, None)
+                if file_info is None:
+                    break
                 
-                # Convert to markdown if needed
-                if downloaded.suffix.lower() in [".docx", ".doc"]:
-                    logger.info("  Converting to markdown...")
-                    markdown_path = convert_to_markdown(downloaded)
-                else:
-                    markdown_path = downloaded
+                file_id = file_info.get("id")
+                file_name = file_info.get("name")
                 
-                # Generate destination filename
-                date = metadata.get("date") or datetime.now(UTC).strftime("%Y-%m-%d")
-                safe_name = file_name.replace(" ", "_")
-                dest_name = f"{date}_{safe_name}"
-                if not dest_name.endswith(".md"):
-                    dest_name = Path(dest_name).stem + ".md"
+                if not file_id or not file_name:
+                    logger.warning(f"Skipping file with missing id or name: {file_info}")
+                    continue
                 
-                dest_path = STAGING_DIR / dest_name
+                logger.info(f"Processing: {file_name}")
                 
-                # Copy to staging
-                import shutil
-                shutil.copy2(markdown_path, dest_path)
-                logger.info(f"  Staged: {dest_path}")
+                try:
+                    if file_id in indexed_ids:
+                        logger.info(f"  Skipped: already staged (Drive ID {file_id})")
+                        results["skipped"].append({
+                            "file": file_name,
+                            "reason": "already_staged"
+                        })
+                        continue
+                    
+                    # Files staged before the index existed are only known by
+                    # name; files still in flight count too
+                    stem = Path(file_name).stem
+                    if any(stem in name for name in staged_names):
+                        logger.info(f"  Skipped: similar file already in staging")
+                        results["skipped"].append({
+                            "file": file_name,
+                            "reason": "similar_file_exists"
+                        })
+                        continue
+                    
+                    # Extract metadata
+                    metadata = extract_meeting_metadata(file_name)
+                    
+                    if dry_run:
+                        logger.info(f"  Would ingest: {file_name}")
+                        logger.info(f"    Date: {metadata.get('date', 'unknown')}")
+                        logger.info(f"    Participants: {metadata.get('participants', [])}")
+                        results["ingested"].append({
+                            "file": file_name,
+                            "metadata": metadata,
+                            "dry_run": True
+                        })
+                        processed += 1
+                        continue
+                    
+                    # Generate destination filename
+                    date = metadata.get("date") or datetime.now(UTC).strftime("%Y-%m-%d")
+                    safe_name = file_name.replace(" ", "_")
+                    dest_name = f"{date}_{safe_name}"
+                    if not dest_name.endswith(".md"):
+                        dest_name = Path(dest_name).stem + ".md"
+                    
+                    # Never overwrite a staged file or one still in flight
+                    if dest_name in staged_names:
+                        logger.info(f"  Skipped: {dest_name} already in staging")
+                        results["skipped"].append({
+                            "file": file_name,
+                            "reason": "similar_file_exists"
+                        })
+                        continue
+                    
+                    staged_names.add(dest_name)
+                    future = pool.submit(stage_file, file_id, file_name, STAGING_DIR / dest_name)
+                    pending[future] = (file_id, file_name, dest_name, metadata)
+                    
+                except Exception as e:
+                    logger.error(f"  Error: {e}")
+                    results["errors"].append({
+                        "file": file_name,
+                        "error": str(e)
+                    })
             
-            results["ingested"].append({
-                "file": file_name,
-                "dest": str(dest_path),
-                "metadata": metadata
-            })
-            processed += 1
+            if not pending:
+                break
             
-        except Exception as e:
-            logger.error(f"  Error: {e}")
-            results["errors"].append({
-                "file": file_name,
-                "error": str(e)
-            })
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                file_id, file_name, dest_name, metadata = pending.pop(future)
+                try:
+                    dest_path = future.result()
+                    index.execute(
+                        "INSERT OR REPLACE INTO staged (gdrive_id, file, dest, staged_at) VALUES (?, ?, ?, ?)",
+                        (file_id, file_name, dest_name, datetime.now(UTC).strftime("%Y-%m-%dT%H:%M:%SZ"))
+                    )
+                    indexed_ids.add(file_id)
+                    uncommitted += 1
+                    if uncommitted >= STAGING_INDEX_COMMIT_EVERY:
+                        index.commit()
+                        uncommitted = 0
+                    results["ingested"].append({
+                        "file": file_name,
+                        "dest": str(dest_path),
+                        "metadata": metadata
+                    })
+                    processed += 1
+                except Exception as e:
+                    staged_names.discard(dest_name)
+                    logger.error(f"  Error ({file_name}): {e}")
+                    results["errors"].append({
+                        "file": file_name,
+                        "error": str(e)
+                    })
+    index.close()
+    
+    if processed >= batch_size:
+        logger.info(f"Reached batch size limit ({batch_size})")
     
     # Summary
     logger.info(f"Pull complete: {len(results['ingested'])} ingested, {len(results['skipped'])} skipped, {len(results['errors'])} errors")
@@ -489,8 +915,17 @@ def main():
         help="Output results as JSON"
     )
     
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="List Drive files fresh, ignoring the listing cache"
+    )
+    
     args = parser.parse_args()
     
+    global _listing_cache_enabled
+    _listing_cache_enabled = not args.no_cache
+    
     try:
         results = pull_transcripts(
             dry_run=args.dry_run,
@@ -498,7 +933,7 @@ def main():
         )
         
         if args.json:
-            print(json.dumps(results, indent=2))
+            print(_json_dumps(results).decode())
         else:
             print(f"\nResults:")
             print(f"  Ingested: {len(results['ingested'])}")
@@ -515,7 +950,7 @@ def main():
     except Exception as e:
         logger.error(f"Pull failed: {e}")
         if args.json:
-            print(json.dumps({"error": str(e)}, indent=2))
+            print(_json_dumps({"error": str(e)}).decode())
         return 1
 
 
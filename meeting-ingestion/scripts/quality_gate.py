@@ -6,56 +6,131 @@ Validates meeting readiness before block generation using comprehensive quality
 defined in the quality harness specification.
 """
 
+from __future__ import annotations
+
 import argparse
+import functools
 import json
 import re
 import sys
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any
-import unicodedata
+from typing import Dict, Iterable, List, Optional
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Import HITL functions
-from hitl import add_hitl_item
+from hitl import add_hitl_items
 
+# Transcript line shapes (see extract_conversation_content)
+# One match on "**" lines: metadata ("**Date:** ...") leaves group 2 unset,
+# a timestamped speaker ("**V [00:00:15]:** ...") captures name and text
+_STARSTAR_RE = re.compile(r'\*\*(?:[A-Za-z\s]+:\*\*|([A-Za-z\s]+)\s*\[[\d:]+\]:\*\*\s*(.*))')
+_SIMPLE_SPEAKER_RE = re.compile(r'^([A-Za-z\s]+):\s*(.*)')               # Speaker Name: ...
+_BLANK_RE = re.compile(r'^[\s\-\*]*$')                                   # only dashes/stars
 
-def extract_conversation_content(content: str) -> str:
-    """Extract actual spoken content from transcript."""
-    lines = content.split('\n')
+# Legacy cleanup (see old_extract_conversation_content)
+_FRONTMATTER_RE = re.compile(r'^---.*?^---', re.MULTILINE | re.DOTALL)
+_TIMESTAMP_RE = re.compile(r'\[?\d{2}:\d{2}:\d{2}\]?')
+_LABEL_RE = re.compile(r'^[A-Za-z\s]+:\s*', re.MULTILINE)
+_WS_RE = re.compile(r'\s+')
+
+# Transcript checks
+_SPEAKER_PATTERNS = [
+    re.compile(r'^[A-Za-z\s]+:\s*', re.MULTILINE),  # "Speaker Name: "
+    re.compile(r'\[[A-Za-z\s]+\]'),                # "[Speaker]"
+    re.compile(r'\d{2}:\d{2}:\d{2}'),              # Timestamps
+]
+_WORD_RE = re.compile(r'\w+')  # a maximal \w run is already bounded by \b
+_GENERIC_NAME_RE = re.compile(r'Speaker \d+')
+
+# Speaker formats show up densely when present, so they're only looked for
+# in the opening stretch of a transcript
+SPEAKER_PATTERN_SAMPLE_CHARS = 16384
+
+
+class _NonPrintableTable(dict):
+    """
+    str.translate table that deletes printable and whitespace characters,
+    so what's left of a string is its non-printable characters. Entries are
+    filled in on first sight of each character.
+    """
+    
+    def __missing__(self, codepoint: int) -> Optional[int]:
+        char = chr(codepoint)
+        value = None if char.isprintable() or char.isspace() else codepoint
+        self[codepoint] = value
+        return value
+
+
+_NON_PRINTABLE = _NonPrintableTable()
+
+
+def _json_loads(data):
+    """Parse JSON bytes or str, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj) -> bytes:
+    """Serialize to indented JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode("utf-8")
+
+
+def extract_conversation_content(content: Iterable[str]) -> str:
+    """
+    Extract actual spoken content from transcript.
+    Accepts the transcript text or an iterable of its lines (e.g. an open file).
+    """
+    if isinstance(content, str):
+        content = content.split('\n')
     clean_lines = []
     
-    for line in lines:
-        # Skip markdown headers
-        if line.startswith('#'):
+    for line in content:
+        line = line.rstrip('\n')
+        if not line:
             continue
-            
-        # Skip metadata lines like "**Date:** February 1, 2026"
-        if re.match(r'\*\*[A-Za-z\s]+:\*\*', line):
-            continue
-            
-        # Skip horizontal rules
-        if re.match(r'^-{3,}$', line.strip()):
-            continue
-            
-        # Process speaker lines with timestamps like "**V [00:00:15]:**"
-        speaker_match = re.match(r'\*\*([A-Za-z\s]+)\s*\[[\d:]+\]:\*\*\s*(.*)', line)
-        if speaker_match:
-            spoken_text = speaker_match.group(2).strip()
-            if spoken_text:
-                clean_lines.append(spoken_text)
-            continue
-            
-        # Process simple speaker lines like "Speaker Name: content"
-        simple_speaker_match = re.match(r'^([A-Za-z\s]+):\s*(.*)', line)
-        if simple_speaker_match:
-            spoken_text = simple_speaker_match.group(2).strip()
-            if spoken_text:
-                clean_lines.append(spoken_text)
+        
+        # Dispatch on the first character; each line shape has its own prefix
+        c0 = line[0]
+        
+        # Skip markdown headers
+        if c0 == '#':
             continue
+        
+        if c0 == '*':
+            # Skip metadata lines like "**Date:** February 1, 2026" and
+            # process speaker lines with timestamps like "**V [00:00:15]:**"
+            starstar_match = _STARSTAR_RE.match(line)
+            if starstar_match:
+                spoken_text = (starstar_match.group(2) or '').strip()
+                if spoken_text:
+                    clean_lines.append(spoken_text)
+                continue
+        else:
+            # Skip horizontal rules ("---" or longer)
+            stripped = line.strip()
+            if len(stripped) >= 3 and not stripped.strip('-'):
+                continue
             
+            # Process simple speaker lines like "Speaker Name: content"
+            simple_speaker_match = _SIMPLE_SPEAKER_RE.match(line)
+            if simple_speaker_match:
+                spoken_text = simple_speaker_match.group(2).strip()
+                if spoken_text:
+                    clean_lines.append(spoken_text)
+                continue
+        
         # Keep other content lines if they have meaningful text
         line = line.strip()
-        if line and not re.match(r'^[\s\-\*]*$', line):
+        if line and not _BLANK_RE.match(line):
             clean_lines.append(line)
     
     return ' '.join(clean_lines)
@@ -63,26 +138,108 @@ def extract_conversation_content(content: str) -> str:
 def old_extract_conversation_content(content: str) -> str:
     """Extract actual spoken content from transcript."""
     # Strip metadata, timestamps, speaker labels
-    clean_content = re.sub(r'^---.*?^---', '', content, flags=re.MULTILINE | re.DOTALL)
-    clean_content = re.sub(r'\[?\d{2}:\d{2}:\d{2}\]?', '', clean_content)
-    clean_content = re.sub(r'^[A-Za-z\s]+:\s*', '', clean_content, flags=re.MULTILINE)
-    clean_content = re.sub(r'\s+', ' ', clean_content).strip()
+    clean_content = _FRONTMATTER_RE.sub('', content)
+    clean_content = _TIMESTAMP_RE.sub('', clean_content)
+    clean_content = _LABEL_RE.sub('', clean_content)
+    clean_content = _WS_RE.sub(' ', clean_content).strip()
     return clean_content
 
 
+@dataclass
+class TranscriptStats:
+    """Everything the transcript checks need, gathered in one read of the file."""
+    clean_content: str = ""
+    printable_chars: int = 0
+    total_chars: int = 0
+    speaker_pattern_hits: int = 0
+    has_replacement_chars: bool = False
+    error: Optional[Exception] = None  # read/decode failure, reported by each check
+
+
+def read_transcript_stats(transcript_path: Path) -> TranscriptStats:
+    """
+    Read a transcript once, streaming it line by line, and collect the
+    conversation text plus the format stats used by every transcript check.
+    """
+    stats = TranscriptStats()
+    unmatched = list(_SPEAKER_PATTERNS)
+    
+    def scan(lines):
+        nonlocal unmatched
+        for line in lines:
+            if unmatched and stats.total_chars < SPEAKER_PATTERN_SAMPLE_CHARS:
+                unmatched = [pattern for pattern in unmatched if not pattern.search(line)]
+            if not stats.has_replacement_chars and '�' in line:
+                stats.has_replacement_chars = True
+            stats.printable_chars += len(line) - len(line.translate(_NON_PRINTABLE))
+            stats.total_chars += len(line)
+            yield line
+    
+    try:
+        with open(transcript_path, 'r', encoding='utf-8') as f:
+            stats.clean_content = extract_conversation_content(scan(f))
+    except Exception as e:
+        stats.error = e
+    
+    stats.speaker_pattern_hits = len(_SPEAKER_PATTERNS) - len(unmatched)
+    return stats
+
+
+@dataclass
+class ParticipantSummary:
+    """Roster facts used by the participant checks, gathered in one pass."""
+    has_host: bool = False
+    has_non_v: bool = False            # anyone other than V
+    has_generic_names: bool = False    # "Speaker 1" style labels
+    has_missing_email: bool = False
+    has_invalid_email: bool = False    # missing or without an "@"
+
+
+def summarize_participants(manifest: Dict) -> ParticipantSummary:
+    """Walk the identified participants once and summarize the roster."""
+    summary = ParticipantSummary()
+    for p in manifest.get('participants', {}).get('identified', []):
+        name = p.get('name') or ''
+        email = p.get('email')
+        if p.get('role') == 'host':
+            summary.has_host = True
+        if name.lower() != 'v':
+            summary.has_non_v = True
+        if _GENERIC_NAME_RE.match(name):
+            summary.has_generic_names = True
+        if not email:
+            summary.has_missing_email = True
+            summary.has_invalid_email = True
+        elif '@' not in email:
+            summary.has_invalid_email = True
+    return summary
+
+
 class QualityCheck:
     """Base class for quality checks."""
     
+    # Slots keep per-check attribute access off the instance dict; each
+    # subclass declares empty __slots__ so none of them grows one either
+    __slots__ = ('name', 'threshold', 'score', 'passed', 'warnings', 'errors', 'escalate_hitl')
+    
+    # Whether execute() reads the transcript stats
+    requires_transcript = False
+    
     def __init__(self, name: str, threshold: float = 0.7):
         self.name = name
         self.threshold = threshold
+        self.reset()
+    
+    def reset(self):
+        """Clear results from a previous run so the check can be reused."""
         self.score = 0.0
         self.passed = False
         self.warnings = []
         self.errors = []
         self.escalate_hitl = False
     
-    def execute(self, manifest: Dict, transcript_path: Optional[Path] = None) -> bool:
+    def execute(self, manifest: Dict, transcript: Optional[TranscriptStats] = None,
+                roster: Optional[ParticipantSummary] = None) -> bool:
         """Execute the quality check. Returns True if passed."""
         raise NotImplementedError()
     
@@ -102,23 +259,24 @@ class QualityCheck:
 class TranscriptLengthCheck(QualityCheck):
     """Check transcript has sufficient content for analysis."""
     
+    __slots__ = ()
+    requires_transcript = True
+    
     def __init__(self):
         super().__init__("transcript_length", threshold=300)
     
-    def execute(self, manifest: Dict, transcript_path: Optional[Path] = None) -> bool:
-        if not transcript_path or not transcript_path.exists():
+    def execute(self, manifest: Dict, transcript: Optional[TranscriptStats] = None,
+                roster: Optional[ParticipantSummary] = None) -> bool:
+        if transcript is None:
             self.errors.append("Transcript file not found")
             self.escalate_hitl = True
             return False
         
         try:
-            with open(transcript_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # Strip metadata, timestamps, speaker labels
-            clean_content = extract_conversation_content(content)
+            if transcript.error:
+                raise transcript.error
             
-            char_count = len(clean_content)
+            char_count = len(transcript.clean_content)
             self.score = min(1.0, char_count / 1000)  # Score based on content richness
             
             if char_count >= self.threshold:
@@ -140,38 +298,33 @@ class TranscriptLengthCheck(QualityCheck):
 class TranscriptFormatCheck(QualityCheck):
     """Validate transcript format and encoding."""
     
+    __slots__ = ()
+    requires_transcript = True
+    
     def __init__(self):
         super().__init__("transcript_format", threshold=0.8)
     
-    def execute(self, manifest: Dict, transcript_path: Optional[Path] = None) -> bool:
-        if not transcript_path or not transcript_path.exists():
+    def execute(self, manifest: Dict, transcript: Optional[TranscriptStats] = None,
+                roster: Optional[ParticipantSummary] = None) -> bool:
+        if transcript is None:
             self.errors.append("Transcript file not found")
             self.escalate_hitl = True
             return False
         
         try:
-            with open(transcript_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            if transcript.error:
+                raise transcript.error
             
             # Check for speaker patterns
-            speaker_patterns = [
-                r'^[A-Za-z\s]+:\s*',  # "Speaker Name: "
-                r'\[[A-Za-z\s]+\]',   # "[Speaker]"
-                r'\d{2}:\d{2}:\d{2}', # Timestamps
-            ]
-            
-            pattern_matches = 0
-            for pattern in speaker_patterns:
-                if re.search(pattern, content, re.MULTILINE):
-                    pattern_matches += 1
+            pattern_matches = transcript.speaker_pattern_hits
             
             # Check for encoding issues
-            has_replacement_chars = '�' in content
+            has_replacement_chars = transcript.has_replacement_chars
             
             # Check if it's mostly readable text
-            printable_ratio = sum(1 for c in content if c.isprintable() or c.isspace()) / len(content)
+            printable_ratio = transcript.printable_chars / transcript.total_chars
             
-            self.score = (pattern_matches / len(speaker_patterns) + printable_ratio) / 2
+            self.score = (pattern_matches / len(_SPEAKER_PATTERNS) + printable_ratio) / 2
             
             if has_replacement_chars:
                 self.errors.append("Encoding corruption detected (replacement characters)")
@@ -197,11 +350,15 @@ class TranscriptFormatCheck(QualityCheck):
 class DurationConsistencyCheck(QualityCheck):
     """Check transcript length matches expected meeting duration."""
     
+    __slots__ = ()
+    requires_transcript = True
+    
     def __init__(self):
         super().__init__("meeting_duration_consistency", threshold=0.5)
     
-    def execute(self, manifest: Dict, transcript_path: Optional[Path] = None) -> bool:
-        if not transcript_path or not transcript_path.exists():
+    def execute(self, manifest: Dict, transcript: Optional[TranscriptStats] = None,
+                roster: Optional[ParticipantSummary] = None) -> bool:
+        if transcript is None:
             self.errors.append("Transcript file not found")
             return False
         
@@ -213,14 +370,11 @@ class DurationConsistencyCheck(QualityCheck):
                 self.passed = True  # Not a hard failure
                 return True
             
-            with open(transcript_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            if transcript.error:
+                raise transcript.error
             
-            # Strip metadata, timestamps, speaker labels
-            clean_content = extract_conversation_content(content)
-            
-            # Count words (rough approximation)
-            word_count = len(re.findall(r'\b\w+\b', clean_content))
+            # Count words (rough approximation) without building a list of them
+            word_count = sum(1 for _ in _WORD_RE.finditer(transcript.clean_content))
             
             # Expected: 75-300 words per minute
             expected_min = duration_minutes * 75
@@ -252,10 +406,13 @@ class DurationConsistencyCheck(QualityCheck):
 class ParticipantConfidenceCheck(QualityCheck):
     """Check participant identification confidence."""
     
+    __slots__ = ()
+    
     def __init__(self):
         super().__init__("participant_confidence", threshold=0.7)
     
-    def execute(self, manifest: Dict, transcript_path: Optional[Path] = None) -> bool:
+    def execute(self, manifest: Dict, transcript: Optional[TranscriptStats] = None,
+                roster: Optional[ParticipantSummary] = None) -> bool:
         participants = manifest.get('participants', {})
         confidence = participants.get('confidence', 0.0)
         
@@ -276,14 +433,15 @@ class ParticipantConfidenceCheck(QualityCheck):
 class HostIdentifiedCheck(QualityCheck):
     """Validate meeting host is identified."""
     
+    __slots__ = ()
+    
     def __init__(self):
         super().__init__("host_identified", threshold=1.0)
     
-    def execute(self, manifest: Dict, transcript_path: Optional[Path] = None) -> bool:
-        participants = manifest.get('participants', {})
-        identified = participants.get('identified', [])
-        
-        has_host = any(p.get('role') == 'host' for p in identified)
+    def execute(self, manifest: Dict, transcript: Optional[TranscriptStats] = None,
+                roster: Optional[ParticipantSummary] = None) -> bool:
+        roster = roster or summarize_participants(manifest)
+        has_host = roster.has_host
         
         self.score = 1.0 if has_host else 0.0
         self.passed = has_host
@@ -301,22 +459,22 @@ class HostIdentifiedCheck(QualityCheck):
 class ExternalParticipantVerificationCheck(QualityCheck):
     """Verify external participants are properly identified."""
     
+    __slots__ = ()
+    
     def __init__(self):
         super().__init__("external_participant_verification", threshold=1.0)
     
-    def execute(self, manifest: Dict, transcript_path: Optional[Path] = None) -> bool:
+    def execute(self, manifest: Dict, transcript: Optional[TranscriptStats] = None,
+                roster: Optional[ParticipantSummary] = None) -> bool:
         meeting_type = manifest.get('meeting', {}).get('type')
-        participants = manifest.get('participants', {})
-        identified = participants.get('identified', [])
+        roster = roster or summarize_participants(manifest)
         
         if meeting_type == 'external':
             # External meetings should have at least one non-V participant
-            external_participants = [p for p in identified if p.get('name', '').lower() != 'v']
-            has_external = len(external_participants) > 0
+            has_external = roster.has_non_v
             
             # Check for generic speaker names
-            generic_names = [p for p in identified if re.match(r'Speaker \d+', p.get('name', ''))]
-            has_generic = len(generic_names) > 0
+            has_generic = roster.has_generic_names
             
             if has_external and not has_generic:
                 self.score = 1.0
@@ -333,8 +491,7 @@ class ExternalParticipantVerificationCheck(QualityCheck):
         
         elif meeting_type == 'internal':
             # Internal meetings should have known participants
-            unknown_external = [p for p in identified if not p.get('email')]
-            if unknown_external:
+            if roster.has_missing_email:
                 self.score = 0.7
                 self.warnings.append("Internal meeting with unidentified participants")
             else:
@@ -353,10 +510,13 @@ class ExternalParticipantVerificationCheck(QualityCheck):
 class CalendarMatchScoreCheck(QualityCheck):
     """Validate calendar event matching."""
     
+    __slots__ = ()
+    
     def __init__(self):
         super().__init__("calendar_match_score", threshold=0.6)
     
-    def execute(self, manifest: Dict, transcript_path: Optional[Path] = None) -> bool:
+    def execute(self, manifest: Dict, transcript: Optional[TranscriptStats] = None,
+                roster: Optional[ParticipantSummary] = None) -> bool:
         calendar_match = manifest.get('calendar_match')
         
         if not calendar_match:
@@ -386,13 +546,14 @@ class CalendarMatchScoreCheck(QualityCheck):
 class MeetingTypeConsistencyCheck(QualityCheck):
     """Check meeting type aligns with participants."""
     
+    __slots__ = ()
+    
     def __init__(self):
         super().__init__("meeting_type_consistency", threshold=1.0)
     
-    def execute(self, manifest: Dict, transcript_path: Optional[Path] = None) -> bool:
+    def execute(self, manifest: Dict, transcript: Optional[TranscriptStats] = None,
+                roster: Optional[ParticipantSummary] = None) -> bool:
         meeting_type = manifest.get('meeting', {}).get('type')
-        participants = manifest.get('participants', {})
-        identified = participants.get('identified', [])
         
         if not meeting_type:
             self.score = 0.0
@@ -401,8 +562,8 @@ class MeetingTypeConsistencyCheck(QualityCheck):
             return True
         
         # Check consistency
-        external_participants = [p for p in identified if not p.get('email') or '@' not in p.get('email', '')]
-        has_external = len(external_participants) > 0
+        roster = roster or summarize_participants(manifest)
+        has_external = roster.has_invalid_email
         
         if meeting_type == 'external' and has_external:
             self.score = 1.0
@@ -420,6 +581,31 @@ class MeetingTypeConsistencyCheck(QualityCheck):
         return self.passed
 
 
+# Every check, keyed by its config name, in the order the gate runs them
+_CHECK_REGISTRY = {
+    "transcript_length": TranscriptLengthCheck,
+    "transcript_format": TranscriptFormatCheck,
+    "meeting_duration_consistency": DurationConsistencyCheck,
+    "participant_confidence": ParticipantConfidenceCheck,
+    "host_identified": HostIdentifiedCheck,
+    "external_participant_verification": ExternalParticipantVerificationCheck,
+    "calendar_match_score": CalendarMatchScoreCheck,
+    "meeting_type_consistency": MeetingTypeConsistencyCheck,
+}
+
+
+@functools.lru_cache(maxsize=8)
+def _read_config_file(path: str, mtime_ns: int) -> Dict:
+    """
+    Parse a quality gate config YAML. Cached per path and modification time,
+    so gates built repeatedly in one process parse an unchanged file once.
+    """
+    import yaml
+    
+    with open(path, 'r') as f:
+        return yaml.safe_load(f)
+
+
 class QualityGate:
     """Main quality gate implementation."""
     
@@ -452,39 +638,25 @@ class QualityGate:
         
         if config_path and config_path.exists():
             try:
-                with open(config_path, 'r') as f:
-                    import yaml
-                    user_config = yaml.safe_load(f)
-                    default_config.update(user_config)
+                user_config = _read_config_file(str(config_path), config_path.stat().st_mtime_ns)
+                default_config.update(user_config)
             except Exception:
                 pass  # Use defaults on error
         
         return default_config
     
     def _init_checks(self) -> List[QualityCheck]:
-        """Initialize quality checks."""
-        all_checks = [
-            TranscriptLengthCheck(),
-            TranscriptFormatCheck(),
-            DurationConsistencyCheck(),
-            ParticipantConfidenceCheck(),
-            HostIdentifiedCheck(),
-            ExternalParticipantVerificationCheck(),
-            CalendarMatchScoreCheck(),
-            MeetingTypeConsistencyCheck(),
-        ]
-        
-        # Filter enabled checks
+        """Initialize the enabled quality checks (disabled ones are never built)."""
         enabled = self.config.get("checks_enabled", {})
-        return [check for check in all_checks if enabled.get(check.name, True)]
+        return [check_cls() for name, check_cls in _CHECK_REGISTRY.items() if enabled.get(name, True)]
     
     def execute(self, manifest_path: Path, transcript_path: Optional[Path] = None) -> Dict:
         """Execute all quality checks."""
         
         # Load manifest
         try:
-            with open(manifest_path, 'r') as f:
-                manifest = json.load(f)
+            with open(manifest_path, 'rb') as f:
+                manifest = _json_loads(f.read())
         except Exception as e:
             return {
                 "passed": False,
@@ -496,6 +668,20 @@ class QualityGate:
         # Ensure transcript_path is a Path object
         if transcript_path is not None and not isinstance(transcript_path, Path):
             transcript_path = Path(transcript_path)
+        
+        # Check for the transcript once, and read it once for every check
+        # that needs it (not at all if none of those are enabled)
+        has_transcript = transcript_path is not None and transcript_path.exists()
+        transcript = None
+        if has_transcript and any(check.requires_transcript for check in self.checks):
+            transcript = read_transcript_stats(transcript_path)
+        
+        # Summarize the participant roster once for the participant checks;
+        # if the roster is malformed, each check hits (and reports) the error
+        try:
+            roster = summarize_participants(manifest)
+        except Exception:
+            roster = None
 
         # Run checks
         check_results = []
@@ -504,8 +690,9 @@ class QualityGate:
         hitl_escalations = []
         
         for check in self.checks:
+            check.reset()
             try:
-                check.execute(manifest, transcript_path)
+                check.execute(manifest, transcript, roster)
                 check_results.append(check.to_dict())
                 total_score += check.score
                 
@@ -545,17 +732,20 @@ class QualityGate:
                       critical_failures == 0 and
                       len(hitl_escalations) == 0)
         
+        # One timestamp for the gate run, its status change and history entry
+        now_iso = datetime.now(timezone.utc).isoformat()
+        
         # Update manifest quality gate
         quality_gate = {
             "passed": self.passed,
             "checks": {
-                "has_transcript": transcript_path is not None and transcript_path.exists(),
+                "has_transcript": has_transcript,
                 "participants_identified": manifest.get('participants', {}).get('confidence', 0) >= 0.5,
                 "meeting_type_determined": bool(manifest.get('meeting', {}).get('type')),
                 "no_hitl_pending": len(hitl_escalations) == 0
             },
             "score": self.overall_score,
-            "executed_at": datetime.now(timezone.utc).isoformat(),
+            "executed_at": now_iso,
             "check_results": check_results
         }
         
@@ -564,19 +754,20 @@ class QualityGate:
         if self.passed:
             # Update status to gated
             manifest["status"] = "gated"
-            manifest["timestamps"]["gated_at"] = datetime.now(timezone.utc).isoformat()
+            manifest["timestamps"]["gated_at"] = now_iso
             
             # Add to status history
             if "status_history" not in manifest:
                 manifest["status_history"] = []
             manifest["status_history"].append({
                 "status": "gated",
-                "at": datetime.now(timezone.utc).isoformat()
+                "at": now_iso
             })
         
         try:
-            with open(manifest_path, 'w') as f:
-                json.dump(manifest, f, indent=2)
+            data = _json_dumps(manifest)
+            with open(manifest_path, 'wb') as f:
+                f.write(data)
         except Exception as e:
             quality_gate["manifest_update_error"] = str(e)
         
@@ -584,15 +775,17 @@ class QualityGate:
         if self.config.get("hitl_escalation", True) and hitl_escalations:
             meeting_id = manifest.get("meeting_id", "unknown")
             
-            for escalation in hitl_escalations:
-                try:
-                    hitl_id = add_hitl_item(
-                        meeting_id=meeting_id,
-                        reason="quality_check_failure",
-                        context=escalation["context"]
-                    )
+            # One queue write for every escalation of this meeting
+            try:
+                hitl_ids = add_hitl_items(
+                    meeting_id=meeting_id,
+                    reason="quality_check_failure",
+                    contexts=[escalation["context"] for escalation in hitl_escalations]
+                )
+                for escalation, hitl_id in zip(hitl_escalations, hitl_ids):
                     escalation["hitl_id"] = hitl_id
-                except Exception as e:
+            except Exception as e:
+                for escalation in hitl_escalations:
                     escalation["hitl_error"] = str(e)
         
         return {
@@ -627,7 +820,7 @@ def main():
     results = gate.execute(manifest_path, transcript_path)
     
     if args.json:
-        print(json.dumps(results, indent=2))
+        print(_json_dumps(results).decode())
     else:
         # Human-readable output
         print(f"Quality Gate: {'✓ PASSED' if results['passed'] else '✗ FAILED'}")
@@ -11,7 +11,9 @@ Usage:
     python3 stage.py [--dry-run]
 """
 
+import functools
 import json
+import os
 import re
 import logging
 import shutil
@@ -19,6 +21,11 @@ from pathlib import Path
 from datetime import datetime, UTC
 from typing import Optional
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logging.basicConfig(
     level=logging.INFO,
     format="%(asctime)s %(levelname)s %(message)s"
@@ -27,15 +34,62 @@ logger = logging.getLogger(__name__)
 
 INBOX = Path("./Personal/Meetings/Inbox")
 
+# Cache size for the pure filename parsers; names repeat across re-runs
+NAME_CACHE_SIZE = 2048
+
+# Filename parsing
+_HAS_4DIGITS_RE = re.compile(r'\d{4}')  # both date patterns need a 4-digit run
+_DATE_RE = re.compile(r'(\d{4}-\d{2}-\d{2})')
+_DATE_LOOSE_RE = re.compile(r'(\d{4})\D?(\d{2})\D?(\d{2})')
+_TRANSCRIPT_SUFFIX_RE = re.compile(r'-transcript.*$', re.IGNORECASE)
+_EXT_RE = re.compile(r'\.(md|txt|docx)$', re.IGNORECASE)
+_MD_TXT_EXT_RE = re.compile(r'\.(md|txt)$')
+_WS_SEP_RE = re.compile(r'[_\-\s]+')
+# Explicit participant separators, highest priority first, with their splitters
+_PARTICIPANT_SEPS = tuple(
+    (sep, re.compile(re.escape(sep), re.IGNORECASE))
+    for sep in ['_x_', ' x ', '_and_', ' and ', '_&_', ' & ']
+)
+_UNDERSCORE_WS_RE = re.compile(r'[_\s]+')
+_DASHES_RE = re.compile(r'-+')
+_DOMAIN_SUFFIX_RE = re.compile(r'(gmailcom|mycareerspancom|theapplyai|com|ai|org)$', re.IGNORECASE)
+_NON_ALPHA_RE = re.compile(r'[^a-zA-Z\s]')
+
+# Block files (B01_RECAP.md etc.)
+_BLOCK_PREFIX_RE = re.compile(r'^B\d{2}_')
+_BLOCK_RE = re.compile(r'^B\d{2}_.*\.md$')
+_BLOCK_CAPTURE_RE = re.compile(r'^(B\d{2}_[A-Z_]+)\.md$')
+
+
+def _json_dumps(obj) -> bytes:
+    """Serialize to indented JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode("utf-8")
+
+
+def _write_manifest(path: Path, manifest: dict) -> None:
+    """Write manifest.json via a sibling temp file and an atomic rename."""
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_bytes(_json_dumps(manifest))
+    os.replace(tmp, path)
 
+
+def _move(src: Path, dest: Path) -> None:
+    """Rename src to dest, falling back to shutil.move across filesystems."""
+    try:
+        os.replace(src, dest)
+    except OSError:
+        shutil.move(str(src), str(dest))
+
+
+@functools.lru_cache(maxsize=NAME_CACHE_SIZE)
 def extract_date(text: str) -> Optional[str]:
     """Extract YYYY-MM-DD date from text."""
-    patterns = [
-        r'(\d{4}-\d{2}-\d{2})',
-        r'(\d{4})\D?(\d{2})\D?(\d{2})',
-    ]
-    for pattern in patterns:
-        match = re.search(pattern, text)
+    if not _HAS_4DIGITS_RE.search(text):
+        return None
+    for pattern in (_DATE_RE, _DATE_LOOSE_RE):
+        match = pattern.search(text)
         if match:
             if len(match.groups()) == 1:
                 return match.group(1)
@@ -46,29 +100,36 @@ def extract_date(text: str) -> Optional[str]:
 
 def extract_participants(text: str) -> list[str]:
     """Extract participant names from filename."""
-    text = re.sub(r'\d{4}-\d{2}-\d{2}', '', text)
-    text = re.sub(r'-transcript.*$', '', text, flags=re.IGNORECASE)
-    text = re.sub(r'\.(md|txt|docx)$', '', text, flags=re.IGNORECASE)
+    return list(_extract_participants(text))
+
+
+@functools.lru_cache(maxsize=NAME_CACHE_SIZE)
+def _extract_participants(text: str) -> tuple[str, ...]:
+    text = _DATE_RE.sub('', text)
+    text = _TRANSCRIPT_SUFFIX_RE.sub('', text)
+    text = _EXT_RE.sub('', text)
     
-    for sep in ['_x_', ' x ', '_and_', ' and ', '_&_', ' & ']:
-        if sep in text.lower():
-            parts = re.split(re.escape(sep), text, flags=re.IGNORECASE)
-            return [clean_name(p) for p in parts if clean_name(p)]
+    text_lower = text.lower()
+    for sep, sep_re in _PARTICIPANT_SEPS:
+        if sep in text_lower:
+            parts = sep_re.split(text)
+            return tuple(clean_name(p) for p in parts if clean_name(p))
     
-    parts = re.split(r'[_\-\s]+', text)
+    parts = _WS_SEP_RE.split(text)
     names = []
     for part in parts:
         cleaned = clean_name(part)
         if cleaned and len(cleaned) > 2:
             names.append(cleaned)
-    return names[:3]
+    return tuple(names[:3])
 
 
+@functools.lru_cache(maxsize=NAME_CACHE_SIZE)
 def clean_name(name: str) -> str:
     """Clean a participant name."""
     name = name.strip()
-    name = re.sub(r'(gmailcom|mycareerspancom|theapplyai|com|ai|org)$', '', name, flags=re.IGNORECASE)
-    name = re.sub(r'[^a-zA-Z\s]', '', name)
+    name = _DOMAIN_SUFFIX_RE.sub('', name)
+    name = _NON_ALPHA_RE.sub('', name)
     name = name.strip()
     if name:
         return name.title()
@@ -83,11 +144,11 @@ def generate_folder_name(date: str, participants: list[str], original: str) -> s
     if participants:
         name_part = "-".join(p.replace(" ", "") for p in participants[:2])
     else:
-        cleaned = re.sub(r'\d{4}-\d{2}-\d{2}', '', original)
-        cleaned = re.sub(r'-transcript.*$', '', cleaned, flags=re.IGNORECASE)
-        cleaned = re.sub(r'\.(md|txt)$', '', cleaned)
-        cleaned = re.sub(r'[_\s]+', '-', cleaned)
-        cleaned = re.sub(r'-+', '-', cleaned)
+        cleaned = _DATE_RE.sub('', original)
+        cleaned = _TRANSCRIPT_SUFFIX_RE.sub('', cleaned)
+        cleaned = _MD_TXT_EXT_RE.sub('', cleaned)
+        cleaned = _UNDERSCORE_WS_RE.sub('-', cleaned)
+        cleaned = _DASHES_RE.sub('-', cleaned)
         cleaned = cleaned.strip('-')
         name_part = cleaned[:40] if cleaned else "meeting"
     
@@ -117,6 +178,11 @@ def create_manifest(folder: Path, date: str, participants: list[str],
 
 def detect_meeting_type(name: str, participants: list[str]) -> str:
     """Detect if meeting is internal or external."""
+    return _detect_meeting_type(name, tuple(participants or ()))
+
+
+@functools.lru_cache(maxsize=NAME_CACHE_SIZE)
+def _detect_meeting_type(name: str, participants: tuple[str, ...]) -> str:
     internal_keywords = ['standup', 'internal', 'sync', 'team', 'planning', 'retro']
     careerspan_people = ['<team_member_1>', '<team_member_2>', '<team_member_3>', '<team_member_4>', '<user>']
     
@@ -169,13 +235,13 @@ def stage_file(file_path: Path, dry_run: bool = False) -> dict:
     target_folder.mkdir(parents=True, exist_ok=True)
     
     transcript_dest = target_folder / "transcript.md"
-    shutil.move(str(file_path), str(transcript_dest))
+    _move(file_path, transcript_dest)
     logger.info(f"  Moved to: {transcript_dest}")
     
     meeting_type = detect_meeting_type(folder_name, participants)
     manifest = create_manifest(target_folder, date, participants, "transcript.md", meeting_type)
     manifest_path = target_folder / "manifest.json"
-    manifest_path.write_text(json.dumps(manifest, indent=2))
+    _write_manifest(manifest_path, manifest)
     logger.info(f"  Created manifest.json (status: staged)")
     
     result["success"] = True
@@ -191,14 +257,31 @@ def stage_folder(folder_path: Path, dry_run: bool = False) -> dict:
         "action": "verify_folder"
     }
     
-    transcript = None
-    for pattern in ["transcript.md", "*.md", "*.txt"]:
-        files = list(folder_path.glob(pattern))
-        # Filter out block files when looking for transcript
-        files = [f for f in files if not re.match(r'^B\d{2}_', f.name)]
-        if files:
-            transcript = files[0]
-            break
+    # One listing: transcript candidates in glob order, plus block files
+    transcript_md = other_md = other_txt = None
+    existing_blocks = []
+    with os.scandir(folder_path) as it:
+        for entry in it:
+            name = entry.name
+            if name == "transcript.md":
+                transcript_md = entry
+                continue
+            # Unlike Path.glob on 3.11, hidden files (macOS "._*" sidecars,
+            # in-progress ".*.tmp"/".*.partial" writes) are never transcripts
+            if name.startswith("."):
+                continue
+            if _BLOCK_PREFIX_RE.match(name):
+                match = _BLOCK_CAPTURE_RE.match(name)
+                if match and entry.is_file():
+                    existing_blocks.append(match.group(1))
+            elif other_md is None and name.endswith(".md"):
+                other_md = entry
+            elif other_txt is None and name.endswith(".txt"):
+                other_txt = entry
+    
+    transcript = transcript_md or other_md or other_txt
+    if transcript:
+        transcript = Path(transcript.path)
     
     if not transcript:
         result["error"] = "no transcript found"
@@ -230,15 +313,6 @@ def stage_folder(folder_path: Path, dry_run: bool = False) -> dict:
     participants = extract_participants(folder_path.name)
     meeting_type = detect_meeting_type(folder_path.name, participants)
     
-    # Detect existing block files
-    existing_blocks = []
-    block_pattern = re.compile(r'^(B\d{2}_[A-Z_]+)\.md$')
-    for f in folder_path.iterdir():
-        if f.is_file():
-            match = block_pattern.match(f.name)
-            if match:
-                existing_blocks.append(match.group(1))
-    
     # Determine status based on existing blocks
     status = "staged"
     if existing_blocks:
@@ -251,7 +325,7 @@ def stage_folder(folder_path: Path, dry_run: bool = False) -> dict:
         manifest["blocks_generated"] = existing_blocks
         if existing_blocks:
             manifest["processed_at"] = datetime.now(UTC).isoformat().replace("+00:00", "Z")
-        manifest_path.write_text(json.dumps(manifest, indent=2))
+        _write_manifest(manifest_path, manifest)
         logger.info(f"  Created manifest.json (status: {status})")
     
     result["success"] = True
@@ -259,16 +333,27 @@ def stage_folder(folder_path: Path, dry_run: bool = False) -> dict:
     return result
 
 
-def fix_inbox_mess(dry_run: bool = False) -> dict:
-    """Fix orphaned block files in Inbox root."""
+def scan_inbox() -> list[os.DirEntry]:
+    """List Inbox entries once, sorted by name, with cached file types."""
+    with os.scandir(INBOX) as it:
+        return sorted(it, key=lambda entry: entry.name)
+
+
+def fix_inbox_mess(dry_run: bool = False,
+                   entries: Optional[list[os.DirEntry]] = None) -> dict:
+    """Fix orphaned block files in Inbox root.
+
+    Pass ``entries`` from scan_inbox() to reuse an existing listing.
+    """
     logger.info("Checking for orphaned files in Inbox root...")
     
-    block_pattern = re.compile(r'^B\d{2}_.*\.md$')
-    orphaned_files = []
+    if entries is None:
+        entries = scan_inbox()
     
-    for item in INBOX.iterdir():
-        if item.is_file() and block_pattern.match(item.name):
-            orphaned_files.append(item)
+    orphaned_files = [
+        Path(entry.path) for entry in entries
+        if _BLOCK_RE.match(entry.name) and entry.is_file()
+    ]
     
     orphan_manifest = INBOX / "manifest.json"
     if orphan_manifest.exists():
@@ -289,7 +374,7 @@ def fix_inbox_mess(dry_run: bool = False) -> dict:
         quarantine.mkdir(exist_ok=True)
         for f in orphaned_files:
             dest = quarantine / f.name
-            shutil.move(str(f), str(dest))
+            _move(f, dest)
             logger.info(f"  Moved to _orphaned_blocks/: {f.name}")
     else:
         for f in orphaned_files:
@@ -304,8 +389,7 @@ def fix_inbox_mess(dry_run: bool = False) -> dict:
 
 def is_orphaned_block(filename: str) -> bool:
     """Check if a file is an orphaned block file (not a transcript)."""
-    block_pattern = re.compile(r'^B\d{2}_.*\.md$')
-    return bool(block_pattern.match(filename)) or filename == "manifest.json"
+    return bool(_BLOCK_RE.match(filename)) or filename == "manifest.json"
 
 
 def is_transcript_file(filename: str) -> bool:
@@ -315,7 +399,7 @@ def is_transcript_file(filename: str) -> bool:
     lower = filename.lower()
     return (lower.endswith(('.md', '.txt')) and 
             ('transcript' in lower or 
-             re.search(r'\d{4}-\d{2}-\d{2}', filename)))
+             _DATE_RE.search(filename)))
 
 
 def stage_all(dry_run: bool = False) -> dict:
@@ -324,8 +408,10 @@ def stage_all(dry_run: bool = False) -> dict:
         logger.error(f"Inbox not found: {INBOX}")
         return {"error": "inbox_not_found"}
     
+    entries = scan_inbox()
+    
     # FIRST: Quarantine orphaned blocks before staging
-    fix_result = fix_inbox_mess(dry_run)
+    fix_result = fix_inbox_mess(dry_run, entries)
     
     results = {
         "fix_result": fix_result,
@@ -334,17 +420,24 @@ def stage_all(dry_run: bool = False) -> dict:
         "errors": []
     }
     
-    # Re-scan after quarantine (files may have been moved)
-    for item in sorted(INBOX.iterdir()):
-        if item.name.startswith((".", "_")):
+    # Drop entries the quarantine moved instead of re-scanning the Inbox
+    if fix_result.get("orphaned_files") and not dry_run:
+        entries = [e for e in entries
+                   if not is_orphaned_block(e.name) or os.path.lexists(e.path)]
+    
+    for entry in entries:
+        if entry.name.startswith((".", "_")):
             continue
         
+        item = Path(entry.path)
+        is_file = entry.is_file()
+        
         # Skip orphaned blocks (should already be quarantined, but safety check)
-        if item.is_file() and is_orphaned_block(item.name):
+        if is_file and is_orphaned_block(item.name):
             logger.info(f"Skipping orphaned block: {item.name}")
             continue
         
-        if item.is_file() and item.suffix in [".md", ".txt"]:
+        if is_file and item.suffix in [".md", ".txt"]:
             # Only stage files that look like transcripts
             if not is_transcript_file(item.name):
                 logger.info(f"Skipping non-transcript file: {item.name}")
@@ -360,7 +453,7 @@ def stage_all(dry_run: bool = False) -> dict:
                 logger.error(f"  Error staging {item.name}: {e}")
                 results["errors"].append({"file": item.name, "error": str(e)})
         
-        elif item.is_dir():
+        elif entry.is_dir():
             try:
                 result = stage_folder(item, dry_run)
                 if result.get("action") == "already_staged":